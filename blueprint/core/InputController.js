@@ -14,10 +14,18 @@ export class InputController {
         // Wiring state
         this.isWiring = false;
         this.activePin = null;
+        // Latest pointer position for the ghost wire, drawn at most once per frame
+        this.ghostPointer = null;
+        this.ghostFrameRequested = false;
         
         // Node dragging state
         this.isDraggingNode = false;
-        this.nodeDragOffsets = new Map();
+        // Nodes being dragged, with their slots and pointer offsets in
+        // parallel arrays so each mousemove is a flat loop over numbers
+        this.dragNodes = [];
+        this.dragSlots = new Int32Array(0);
+        this.dragOffX = new Float64Array(0);
+        this.dragOffY = new Float64Array(0);
         
         // Panning state
         this.isRmbDown = false;
@@ -95,16 +103,20 @@ export class InputController {
             }
 
             const mouseGraphCoords = this.graph.getGraphCoords(e.clientX, e.clientY);
-            this.nodeDragOffsets.clear();
+            this.dragNodes = [];
             for (const nodeId of this.graph.selectedNodes) {
                 const node = this.graph.nodes.get(nodeId);
-                if (node) {
-                    this.nodeDragOffsets.set(nodeId, {
-                        x: mouseGraphCoords.x - node.x,
-                        y: mouseGraphCoords.y - node.y
-                    });
-                }
+                if (node) this.dragNodes.push(node);
             }
+            const count = this.dragNodes.length;
+            this.dragSlots = new Int32Array(count);
+            this.dragOffX = new Float64Array(count);
+            this.dragOffY = new Float64Array(count);
+            this.dragNodes.forEach((node, k) => {
+                this.dragSlots[k] = node.slot;
+                this.dragOffX[k] = mouseGraphCoords.x - node.x;
+                this.dragOffY[k] = mouseGraphCoords.y - node.y;
+            });
 
             document.addEventListener('mousemove', this.handleGlobalMouseMove);
             document.addEventListener('mouseup', this.handleGlobalMouseUp);
@@ -128,7 +140,7 @@ export class InputController {
             this.isMarqueeing = true;
             this.marqueeStart.x = e.clientX;
             this.marqueeStart.y = e.clientY;
-            const rect = this.editor.getBoundingClientRect();
+            const rect = this.graph.getEditorRect();
             this.marqueeEl.style.display = 'block';
             this.marqueeEl.style.left = `${e.clientX - rect.left}px`;
             this.marqueeEl.style.top = `${e.clientY - rect.top}px`;
@@ -161,26 +173,28 @@ export class InputController {
             this.dragStart.y = e.clientY;
         }
         else if (this.isDraggingNode) { // Node Dragging
+            // Read the mouse position once and update every position in the
+            // graph's buffers, then apply the transforms in a second pass and
+            // redraw all their wires together on the next frame
             const mouseGraphCoords = this.graph.getGraphCoords(e.clientX, e.clientY);
-            for (const nodeId of this.graph.selectedNodes) {
-                const node = this.graph.nodes.get(nodeId);
-                const offset = this.nodeDragOffsets.get(nodeId);
-                if (node && offset) {
-                    node.x = mouseGraphCoords.x - offset.x;
-                    node.y = mouseGraphCoords.y - offset.y;
-                    node.element.style.left = `${node.x}px`;
-                    node.element.style.top = `${node.y}px`;
-                    this.graph.redrawNodeWires(node.id);
-                }
+            const { posX, posY } = this.graph;
+            const { dragSlots, dragOffX, dragOffY } = this;
+            for (let k = 0; k < dragSlots.length; k++) {
+                posX[dragSlots[k]] = mouseGraphCoords.x - dragOffX[k];
+                posY[dragSlots[k]] = mouseGraphCoords.y - dragOffY[k];
+            }
+            for (const node of this.dragNodes) {
+                node.applyPosition();
+                this.graph.scheduleRedraw(node.id);
             }
         }
         else if (this.isWiring) { // Wiring
             if (this.activePin) {
-                this.app.wiring.updateGhostWire(e, this.activePin);
+                this.scheduleGhostWire(e);
             }
         }
         else if (this.isMarqueeing) { // Marqueeing
-            const rect = this.editor.getBoundingClientRect();
+            const rect = this.graph.getEditorRect();
             const left = Math.min(e.clientX, this.marqueeStart.x) - rect.left;
             const top = Math.min(e.clientY, this.marqueeStart.y) - rect.top;
             const width = Math.abs(e.clientX - this.marqueeStart.x);
@@ -192,6 +206,25 @@ export class InputController {
         }
     }
 
+    /**
+     * Records the pointer position and redraws the ghost wire on the next
+     * animation frame. High-rate mice fire many mousemoves per frame; only
+     * the latest position is drawn, so DOM writes are capped at the refresh rate.
+     * @param {MouseEvent} e - The mousemove event.
+     */
+    scheduleGhostWire(e) {
+        this.ghostPointer = { clientX: e.clientX, clientY: e.clientY };
+        if (this.ghostFrameRequested) return;
+        this.ghostFrameRequested = true;
+        requestAnimationFrame(() => {
+            this.ghostFrameRequested = false;
+            // Wiring may have ended (and the ghost wire been hidden) since
+            if (this.isWiring && this.activePin) {
+                this.app.wiring.updateGhostWire(this.ghostPointer, this.activePin);
+            }
+        });
+    }
+
     /**
      * Handle global mouse up to complete drag operations.
      */
@@ -234,7 +267,7 @@ export class InputController {
         if (this.isDraggingNode) {
             this.isDraggingNode = false;
             this.graph.snapSelectedNodesToGrid();
-            this.nodeDragOffsets.clear();
+            this.dragNodes = [];
             this.app.persistence.autoSave();
             this.app.compiler.markDirty();
         }
@@ -276,7 +309,7 @@ export class InputController {
         }
 
         const scaleAmount = 1.1;
-        const rect = this.editor.getBoundingClientRect();
+        const rect = this.graph.getEditorRect();
         const mouseX = e.clientX - rect.left;
         const mouseY = e.clientY - rect.top;
 
@@ -292,7 +325,6 @@ export class InputController {
         this.graph.pan.y = mouseY - mouseGraphY_before * this.graph.zoom;
 
         this.graph.updateTransform();
-        this.app.grid.draw();
         this.graph.zoomReadout.textContent = `${Math.round(this.graph.zoom * 100)}%`;
 
         this.graph.drawAllWires();
@@ -17,12 +17,29 @@ export class Pin {
         this.type = (pinData.type || '').toLowerCase(); // Safe lowercasing
         this.dir = pinData.dir;
         this.element = null;
-        this.links = [];
+        this.widgetElement = null; // Literal input shown while a data input is unlinked
+        // Cached offset from the node origin, valid while offsetElement === element
+        this.offsetElement = null;
+        this.offsetX = 0;
+        this.offsetY = 0;
+        this.links = new Set(); // Link ids, for O(1) add/remove
         this.containerType = pinData.containerType || 'single';
         this.defaultValue = pinData.defaultValue !== undefined ? pinData.defaultValue : this.getDefaultValue();
         this.isCustom = pinData.isCustom || false;
     }
 
+    /**
+     * The pin's logical type. Setting it also refreshes the cached CSS
+     * class and color, so wire drawing reads them as plain fields.
+     */
+    get type() { return this._type; }
+
+    set type(value) {
+        this._type = value;
+        this.typeClass = Utils.getPinTypeClass(value);
+        this.color = Utils.getPinColor(value);
+    }
+
     getDefaultValue() {
         switch (this.type) {
             case 'bool': return false;
@@ -34,7 +51,32 @@ export class Pin {
         }
     }
 
-    isConnected() { return this.links.length > 0; }
+    isConnected() { return this.links.size > 0; }
+
+    /**
+     * Returns the pin's center in graph space.
+     * The offset from the node origin is measured once per rendered pin
+     * element and reused, so redrawing wires as nodes move needs no layout reads.
+     * @param {object} app - The main BlueprintApp object.
+     * @returns {{x: number, y: number}} The world-space coordinates.
+     */
+    getPosition(app) {
+        if (!this.element || !this.element.isConnected) {
+            return Utils.getPinPosition(this.element, app);
+        }
+        if (this.offsetElement !== this.element) {
+            const pos = Utils.getPinPosition(this.element, app);
+            // Only cache once the DOM shows what the model says: while a pan/zoom
+            // or a move of this node waits for its frame, the measured spot is
+            // stale and caching it would misplace the wires until a re-render
+            const graph = app.graph;
+            if (graph.transformPending || graph.pendingPositionNodes.has(this.node)) return pos;
+            this.offsetX = pos.x - this.node.x;
+            this.offsetY = pos.y - this.node.y;
+            this.offsetElement = this.element;
+        }
+        return { x: this.node.x + this.offsetX, y: this.node.y + this.offsetY };
+    }
 
     getMaxLinks() {
         if (this.dir === 'in' && this.type !== 'exec') {
@@ -58,9 +100,16 @@ export class Node {
         this.variableId = nodeData.variableId;
         this.app = app;
         this.nodeKey = nodeKey;
+        // x/y live in the graph's position buffers (see get x / get y)
+        this.graph = app.graph;
+        this.slot = this.graph.allocNodeSlot();
         this.x = x;
         this.y = y;
         this.element = null;
+        // Cached size in graph units, valid while sizeElement === element
+        this.sizeElement = null;
+        this.width = 0;
+        this.height = 0;
 
         this.customData = nodeData.customData || {};
 
@@ -69,10 +118,15 @@ export class Node {
         this.refreshPinCache();
 
         this.pinLiterals = new Map();
+        // Saved pin data by id (first entry wins, as a find() would), so each
+        // pin's literal is a Map lookup instead of a scan over all pin data
+        const pinDataById = new Map();
+        pinDataArray.forEach(pd => { if (!pinDataById.has(pd.id)) pinDataById.set(pd.id, pd); });
+        const prefix = `${this.id}-`;
         this.pins.forEach(p => {
             // Use the pin's default value or the loaded default value if present.
             // When loading, pinData.defaultValue holds the literal value saved.
-            const literalValue = pinDataArray.find(pd => pd.id === p.id.replace(`${this.id}-`, ''))?.literalValue;
+            const literalValue = pinDataById.get(p.id.replace(prefix, ''))?.literalValue;
             this.pinLiterals.set(p.id, literalValue !== undefined ? literalValue : p.defaultValue);
         });
     }
@@ -81,6 +135,8 @@ export class Node {
         if (!this.pins) this.pins = [];
         this.pinsIn = this.pins.filter(p => p.dir === 'in');
         this.pinsOut = this.pins.filter(p => p.dir === 'out');
+        // Full pin id -> Pin; every change to this.pins ends with a refresh
+        this.pinsById = new Map(this.pins.map(p => [p.id, p]));
     }
 
     /**
@@ -89,10 +145,96 @@ export class Node {
      * @returns {Pin|null} The found pin, or null.
      */
     findPinById(pinId) {
-        return this.pins.find(p => p.id === pinId);
+        return this.pinsById.get(pinId) || null;
+    }
+
+    get x() { return this.graph.posX[this.slot]; }
+    set x(value) { this.graph.posX[this.slot] = value; }
+
+    get y() { return this.graph.posY[this.slot]; }
+    set y(value) { this.graph.posY[this.slot] = value; }
+
+    /**
+     * Returns the CSS transform placing the node at (x, y). Nodes are moved
+     * with a transform rather than left/top, so dragging them skips layout.
+     * @returns {string} The transform value.
+     */
+    getPositionTransform() {
+        return `translate3d(${this.x}px, ${this.y}px, 0)`;
+    }
+
+    /** Moves the rendered element to the node's current (x, y). */
+    applyPosition() {
+        if (this.element) this.element.style.transform = this.getPositionTransform();
+        this.graph.spatialIndex.markDirty(this);
+    }
+
+    /**
+     * Returns the node's box in graph space. The size is measured once per
+     * rendered element; offsetWidth/Height ignore the pan/zoom transform, so
+     * it stays valid while the view or the node moves.
+     * @returns {{left: number, top: number, right: number, bottom: number}} The bounds.
+     */
+    getBounds() {
+        if (this.sizeElement !== this.element) {
+            this.width = this.element.offsetWidth;
+            this.height = this.element.offsetHeight;
+            this.sizeElement = this.element;
+        }
+        return { left: this.x, top: this.y, right: this.x + this.width, bottom: this.y + this.height };
+    }
+
+    /**
+     * Drops the cached node size and pin offsets, for when the node's layout
+     * changes without a re-render (re-rendering replaces the elements and
+     * invalidates them on its own).
+     */
+    invalidateLayout() {
+        this.sizeElement = null;
+        this.graph.spatialIndex.markDirty(this);
+        this.pins.forEach(pin => { pin.offsetElement = null; });
+    }
+
+    /**
+     * Updates the rendered pins in place after links were added or removed:
+     * toggles each dot's hollow state and adds or removes the literal input
+     * on data inputs, instead of re-rendering the whole node.
+     */
+    updateConnectedState() {
+        if (!this.element) return;
+        let layoutChanged = false;
+        for (const pin of this.pins) {
+            // Skip pins this node's current layout does not show
+            if (!pin.element || !this.element.contains(pin.element)) continue;
+            const isConnected = pin.isConnected();
+            pin.element.classList.toggle('hollow', !isConnected);
+            if (pin.dir !== 'in' || pin.type === 'exec') continue;
+
+            if (isConnected && pin.widgetElement) {
+                pin.widgetElement.remove();
+                pin.widgetElement = null;
+                layoutChanged = true;
+            } else if (!isConnected && !pin.widgetElement) {
+                const inputWidget = this.createInputWidget(pin);
+                const pinContainer = pin.element.parentNode;
+                const wrapper = pinContainer.querySelector('.pin-wrapper');
+                if (wrapper) {
+                    wrapper.appendChild(inputWidget);
+                } else {
+                    inputWidget.classList.add('compact-input-widget');
+                    pinContainer.appendChild(inputWidget);
+                }
+                pin.widgetElement = inputWidget;
+                layoutChanged = true;
+            }
+        }
+        // Adding or removing an input can change the node's width
+        if (layoutChanged) this.invalidateLayout();
     }
 
     render() {
+        // A new element may have a new size; re-index once it is in the DOM
+        this.graph.spatialIndex.markDirty(this);
 
         if (!this.nodeKey) {
             console.error(`Node ${this.id} missing nodeKey.`);
@@ -110,8 +252,7 @@ export class Node {
         const element = document.createElement('div');
         element.id = this.id;
         element.className = `node ${this.type}`;
-        element.style.left = `${this.x}px`;
-        element.style.top = `${this.y}px`;
+        element.style.transform = this.getPositionTransform();
 
         const header = document.createElement('div');
         header.className = 'node-title';
@@ -161,6 +302,9 @@ export class Node {
                 header.contentEditable = false;
                 this.title = header.textContent;
                 header.classList.remove('editing-title');
+                // The title can change the node's width, moving its output pins
+                this.invalidateLayout();
+                this.app.graph.scheduleRedraw(this.id);
                 if (this.app.details && this.app.graph.selectedNodes.has(this.id)) {
                     if (this.nodeKey === 'CustomEvent') {
                         this.app.details.showNodeDetails(this);
@@ -258,8 +402,7 @@ export class Node {
         const element = document.createElement('div');
         element.id = this.id;
         element.className = `node ${this.type} set-node`;
-        element.style.left = `${this.x}px`;
-        element.style.top = `${this.y}px`;
+        element.style.transform = this.getPositionTransform();
 
         const header = document.createElement('div');
         header.className = 'node-title';
@@ -321,8 +464,7 @@ export class Node {
         const element = document.createElement('div');
         element.id = this.id;
         element.className = `node compact-node ${this.type}`;
-        element.style.left = `${this.x}px`;
-        element.style.top = `${this.y}px`;
+        element.style.transform = this.getPositionTransform();
 
         const container = document.createElement('div');
         container.className = 'compact-node-container';
@@ -338,7 +480,7 @@ export class Node {
         // 1. Left Pin (Input)
         if (pinIn) {
             const pinContainer = document.createElement('div');
-            pinContainer.className = `pin-container in ${Utils.getPinTypeClass(pinIn.type)}`;
+            pinContainer.className = `pin-container in ${pinIn.typeClass}`;
             pinContainer.dataset.pinId = pinIn.id;
 
             const pinDot = this.createPinDot(pinIn);
@@ -346,11 +488,13 @@ export class Node {
             pinContainer.appendChild(pinDot);
 
             // If unconnected, show the input widget (pill-box style)
+            pinIn.widgetElement = null;
             if (!pinIn.isConnected()) {
                 const inputWidget = this.createInputWidget(pinIn);
                 if (inputWidget) {
                     inputWidget.classList.add('compact-input-widget');
                     pinContainer.appendChild(inputWidget);
+                    pinIn.widgetElement = inputWidget;
                 }
             }
 
@@ -371,7 +515,7 @@ export class Node {
         // 3. Right Pin (Output)
         if (pinOut) {
             const pinContainer = document.createElement('div');
-            pinContainer.className = `pin-container out ${Utils.getPinTypeClass(pinOut.type)}`;
+            pinContainer.className = `pin-container out ${pinOut.typeClass}`;
             pinContainer.dataset.pinId = pinOut.id;
 
             const pinDot = this.createPinDot(pinOut);
@@ -387,10 +531,10 @@ export class Node {
     }
 
     createPinDot(pin, forceHollow = false) {
-        const typeClass = Utils.getPinTypeClass(pin.type);
+        const typeClass = pin.typeClass;
         const pinDot = document.createElement('div');
         let dotClasses = `pin-dot ${typeClass}`;
-        const isConnected = pin.links.length > 0;
+        const isConnected = pin.links.size > 0;
         if (forceHollow || !isConnected) {
             dotClasses += ' hollow';
         }
@@ -407,7 +551,7 @@ export class Node {
                 const icon = document.createElement('i');
                 icon.className = 'fas fa-th';
                 icon.style.fontSize = '8px';
-                icon.style.color = Utils.getPinColor(pin.type);
+                icon.style.color = pin.color;
                 pinDot.appendChild(icon);
             } else if (pin.containerType === 'set') {
                 pinDot.classList.add('set-pin');
@@ -415,14 +559,14 @@ export class Node {
                 icon.textContent = '{}';
                 icon.style.fontSize = '8px';
                 icon.style.fontWeight = 'bold';
-                icon.style.color = Utils.getPinColor(pin.type);
+                icon.style.color = pin.color;
                 pinDot.appendChild(icon);
             } else if (pin.containerType === 'map') {
                 pinDot.classList.add('map-pin');
                 const icon = document.createElement('i');
                 icon.className = 'fas fa-list-ul';
                 icon.style.fontSize = '8px';
-                icon.style.color = Utils.getPinColor(pin.type);
+                icon.style.color = pin.color;
                 pinDot.appendChild(icon);
             }
         }
@@ -432,7 +576,7 @@ export class Node {
 
     renderPin(pin, hideLabel = false) {
         const pinContainer = document.createElement('div');
-        const typeClass = Utils.getPinTypeClass(pin.type);
+        const typeClass = pin.typeClass;
         pinContainer.className = `pin-container ${pin.dir} ${typeClass}`;
         pinContainer.dataset.pinId = pin.id;
 
@@ -453,11 +597,12 @@ export class Node {
 
         let inputWidget = null;
         const isDataPin = pin.type !== 'exec';
-        const isConnected = pin.links.length > 0;
+        const isConnected = pin.links.size > 0;
 
         if (pin.dir === 'in' && isDataPin && !isConnected) {
             inputWidget = this.createInputWidget(pin);
         }
+        pin.widgetElement = inputWidget;
 
         if (pin.dir === 'in') {
             pinContainer.appendChild(pinDot);
@@ -0,0 +1,119 @@
+/**
+ * NodeSpatialIndex - Uniform grid over node bounds for area queries.
+ * Lets marquee selection test only the nodes near the rectangle instead of every node.
+ */
+
+// Edge length (graph units) of one grid cell; a typical node spans one or two
+const CELL_SIZE = 256;
+
+export class NodeSpatialIndex {
+    /**
+     * @param {Object} graphController - Reference to the parent GraphController
+     */
+    constructor(graphController) {
+        this.graph = graphController;
+        this.cells = new Map();     // "cx,cy" -> Set of Nodes overlapping that cell
+        this.nodeCells = new Map(); // Node -> keys of the cells it is in
+        this.pending = new Set();   // Nodes moved, resized or re-rendered since last indexed
+    }
+
+    /**
+     * Marks a node for re-indexing. Its bounds are read at the next query,
+     * so calling this on every drag mousemove costs only a Set insert.
+     * @param {Node} node - The node whose position, size or element changed.
+     */
+    markDirty(node) {
+        this.pending.add(node);
+    }
+
+    /**
+     * Removes a node from every cell it is in.
+     * @param {Node} node - The node to remove.
+     */
+    remove(node) {
+        const keys = this.nodeCells.get(node);
+        if (!keys) return;
+        for (const key of keys) {
+            const cell = this.cells.get(key);
+            if (cell && cell.delete(node) && cell.size === 0) this.cells.delete(key);
+        }
+        this.nodeCells.delete(node);
+    }
+
+    /** Empties the index, e.g. when the whole graph is reloaded. */
+    clear() {
+        this.cells.clear();
+        this.nodeCells.clear();
+        this.pending.clear();
+    }
+
+    /**
+     * Returns whether a node is still part of the graph. Deleted nodes are
+     * not reported to the index; they are dropped when next encountered.
+     */
+    isLive(node) {
+        return this.graph.nodes.get(node.id) === node;
+    }
+
+    /** Re-indexes the pending nodes that are rendered; the rest stay pending. */
+    flush() {
+        for (const node of this.pending) {
+            if (!this.isLive(node)) {
+                this.remove(node);
+                this.pending.delete(node);
+            } else if (node.element && node.element.isConnected) {
+                this.insert(node);
+                this.pending.delete(node);
+            }
+        }
+    }
+
+    insert(node) {
+        this.remove(node);
+        const bounds = node.getBounds();
+        const keys = [];
+        this.forEachCell(bounds.left, bounds.top, bounds.right, bounds.bottom, key => {
+            let cell = this.cells.get(key);
+            if (!cell) this.cells.set(key, cell = new Set());
+            cell.add(node);
+            keys.push(key);
+        });
+        this.nodeCells.set(node, keys);
+    }
+
+    forEachCell(left, top, right, bottom, callback) {
+        const x1 = Math.floor(right / CELL_SIZE);
+        const y1 = Math.floor(bottom / CELL_SIZE);
+        for (let cx = Math.floor(left / CELL_SIZE); cx <= x1; cx++) {
+            for (let cy = Math.floor(top / CELL_SIZE); cy <= y1; cy++) {
+                callback(`${cx},${cy}`);
+            }
+        }
+    }
+
+    /**
+     * Finds the nodes whose bounds intersect a rectangle in graph space.
+     * Only nodes in the cells the rectangle touches are tested.
+     * @returns {Set<Node>} The intersecting nodes.
+     */
+    query(left, top, right, bottom) {
+        this.flush();
+        const hits = new Set();
+        this.forEachCell(left, top, right, bottom, key => {
+            const cell = this.cells.get(key);
+            if (!cell) return;
+            for (const node of cell) {
+                if (hits.has(node)) continue;
+                if (!this.isLive(node)) {
+                    this.remove(node);
+                    continue;
+                }
+                const bounds = node.getBounds();
+                if (bounds.left < right && bounds.right > left && bounds.top < bottom && bounds.bottom > top) {
+                    hits.add(node);
+                }
+            }
+        });
+        return hits;
+    }
+}
@@ -73,25 +73,24 @@ export class SelectionController {
      * @param {string} mode - Selection mode: 'add', 'remove', 'toggle', 'new'.
      */
     selectNodesInRect(rect, mode) {
-        for (const node of this.graph.nodes.values()) {
-            const nodeRect = node.element.getBoundingClientRect();
-            // Check if node rect intersects with selection rect
-            const intersects = (
-                nodeRect.left < rect.right &&
-                nodeRect.right > rect.left &&
-                nodeRect.top < rect.bottom &&
-                nodeRect.bottom > rect.top
-            );
-
-            if (intersects) {
-                // Marquee selects the node
-                this.selectNode(node.id, true, mode);
-            } else if (mode === 'new') {
-                // In 'new' mode, if it doesn't intersect, ensure it's unselected
-                this.selectedNodes.delete(node.id);
-                node.element.classList.remove('selected');
+        // Convert the screen-space marquee to graph space once, then test
+        // only the nodes in the grid cells it covers
+        const topLeft = this.graph.getGraphCoords(rect.left, rect.top);
+        const bottomRight = this.graph.getGraphCoords(rect.right, rect.bottom);
+        const hits = this.graph.spatialIndex.query(topLeft.x, topLeft.y, bottomRight.x, bottomRight.y);
+
+        if (mode === 'new') {
+            // In 'new' mode, unselect the selected nodes the marquee missed
+            for (const nodeId of [...this.selectedNodes]) {
+                const node = this.graph.nodes.get(nodeId);
+                if (node && !hits.has(node)) {
+                    this.selectedNodes.delete(nodeId);
+                    node.element.classList.remove('selected');
+                }
             }
         }
+        // Marquee selects the nodes it intersects
+        hits.forEach(node => this.selectNode(node.id, true, mode));
 
         // Re-run selectNode logic for the final set to ensure details panel is updated correctly
         if (this.selectedNodes.size === 1) {
@@ -194,7 +193,8 @@ export class SelectionController {
             });
         }
 
-        // Duplicate internal connections
+        // Duplicate internal connections, collected and connected in one batch
+        const newLinkPairs = [];
         for (const link of this.graph.app.wiring.links.values()) {
             const startNodeIsSelected = this.selectedNodes.has(link.startPin.node.id);
             const endNodeIsSelected = this.selectedNodes.has(link.endPin.node.id);
@@ -208,11 +208,12 @@ export class SelectionController {
                     const newEndPin = this.graph.findPinById(newEndPinId);
 
                     if (newStartPin && newEndPin && this.graph.canConnect(newStartPin, newEndPin)) {
-                        this.graph.app.wiring.createConnection(newStartPin, newEndPin);
+                        newLinkPairs.push([newStartPin, newEndPin]);
                     }
                 }
             }
         }
+        this.graph.app.wiring.bulkConnect(newLinkPairs);
 
         this.graph.app.wiring.clearLinkSelection();
         this.clearSelection();
@@ -228,13 +229,14 @@ export class SelectionController {
     snapSelectedNodesToGrid(gridSize = 10) {
         for (const nodeId of this.selectedNodes) {
             const node = this.graph.nodes.get(nodeId);
-            if (node) {
-                node.x = Math.round(node.x / gridSize) * gridSize;
-                node.y = Math.round(node.y / gridSize) * gridSize;
-                node.element.style.left = `${node.x}px`;
-                node.element.style.top = `${node.y}px`;
-                this.graph.redrawNodeWires(node.id);
-            }
+            if (!node) continue;
+            const x = Math.round(node.x / gridSize) * gridSize;
+            const y = Math.round(node.y / gridSize) * gridSize;
+            // Already-aligned nodes need neither a transform write nor a wire redraw
+            if (x === node.x && y === node.y) continue;
+            node.x = x;
+            node.y = y;
+            this.graph.schedulePositionUpdate(node);
         }
     }
 
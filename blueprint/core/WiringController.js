@@ -4,6 +4,9 @@
  */
 import { Utils } from '../../shared/utils.js';
 
+// Slack (graph units) around a wire's bounds for its stroke when culling
+const WIRE_CULL_MARGIN = 10;
+
 /**
  * Manages wire connections, link selection, and visual wire rendering.
  */
@@ -12,8 +15,27 @@ export class WiringController {
         this.svgGroup = svg.getElementById('wire-group');
         this.ghostWire = svg.getElementById('ghost-wire');
         this.links = new Map();
+        // Reverse indexes (node id / pin id -> Set of link ids), so link
+        // lookups touch only the matching links instead of scanning them all
+        this.linksByNode = new Map();
+        this.linksByPin = new Map();
         this.selectedLinks = new Set();
+        // Endpoints of the last ghost wire path, so idle mouse events that
+        // leave it unchanged skip rewriting its 'd' attribute
+        this.lastGhost = null;
+        // Link ids whose wires are redrawn on the next animation frame
+        this.dirtyLinks = new Set();
+        this.flushScheduled = false;
         this.app = app;
+
+        // One delegated listener for every wire, so listener count does not
+        // grow with the graph (the ghost wire has no link id and is ignored)
+        this.svgGroup.addEventListener('click', (e) => {
+            const wireEl = e.target.closest('path[id^="link-"]');
+            if (!wireEl) return;
+            e.stopPropagation();
+            this.toggleLinkSelection(wireEl.id);
+        });
     }
 
     findLink(linkId) { 
@@ -21,15 +43,67 @@ export class WiringController {
     }
 
     findLinksByNodeId(nodeId) { 
-        return [...this.links.values()].filter(l => l.startPin.node.id === nodeId || l.endPin.node.id === nodeId); 
+        return this._lookupLinks(this.linksByNode, nodeId); 
     }
 
     findLinksByPinId(pinId) { 
-        return [...this.links.values()].filter(l => l.startPin.id === pinId || l.endPin.id === pinId); 
+        return this._lookupLinks(this.linksByPin, pinId); 
+    }
+
+    _lookupLinks(index, key) {
+        const linkIds = index.get(key);
+        return linkIds ? Array.from(linkIds, id => this.links.get(id)) : [];
+    }
+
+    /**
+     * Adds a link to the link map and the node/pin reverse indexes.
+     * All link insertions go through here so the indexes stay in sync.
+     * @param {Object} link - The link ({ id, startPin, endPin }).
+     */
+    registerLink(link) {
+        this.links.set(link.id, link);
+        const { id, startPin, endPin } = link;
+        for (const [index, key] of [
+            [this.linksByNode, startPin.node.id], [this.linksByNode, endPin.node.id],
+            [this.linksByPin, startPin.id], [this.linksByPin, endPin.id],
+        ]) {
+            let linkIds = index.get(key);
+            if (!linkIds) index.set(key, linkIds = new Set());
+            linkIds.add(id);
+        }
+    }
+
+    /**
+     * Removes a link from the link map and the node/pin reverse indexes.
+     * @param {Object} link - The link ({ id, startPin, endPin }).
+     */
+    unregisterLink(link) {
+        this.links.delete(link.id);
+        const { id, startPin, endPin } = link;
+        for (const [index, key] of [
+            [this.linksByNode, startPin?.node?.id], [this.linksByNode, endPin?.node?.id],
+            [this.linksByPin, startPin?.id], [this.linksByPin, endPin?.id],
+        ]) {
+            const linkIds = index.get(key);
+            if (linkIds && linkIds.delete(id) && linkIds.size === 0) index.delete(key);
+        }
+    }
+
+    /**
+     * Removes every link, resetting the reverse indexes with the link map.
+     * Fresh Maps replace the old ones (nothing holds on to them; callers
+     * always go through this.links), so a reload does not refill a table
+     * sized for the previous graph.
+     */
+    clearLinks() {
+        this.links = new Map();
+        this.linksByNode = new Map();
+        this.linksByPin = new Map();
+        this.dirtyLinks.clear();
     }
 
     toggleLinkSelection(linkId) {
-        const wireEl = document.getElementById(linkId);
+        const wireEl = this.links.get(linkId)?.wireEl;
         this.app.graph.clearSelection();
         if (!this.selectedLinks.has(linkId)) {
             this.clearLinkSelection();
@@ -43,7 +117,7 @@ export class WiringController {
 
     clearLinkSelection() {
         this.selectedLinks.forEach(linkId => {
-            const wireEl = document.getElementById(linkId);
+            const wireEl = this.links.get(linkId)?.wireEl;
             if (wireEl) wireEl.classList.remove('link-selected');
         });
         this.selectedLinks.clear();
@@ -55,11 +129,7 @@ export class WiringController {
         const endPin = pinA.dir === 'in' ? pinA : pinB;
 
         // Prevent connection if already exists
-        const linkExists = startPin.links.some(linkId => {
-            const link = this.links.get(linkId);
-            return link && link.endPin.id === endPin.id;
-        });
-        if (linkExists) return;
+        if (this._linkExists(startPin, endPin)) return;
 
         // Break existing connection if input pin is single-link
         if (endPin.getMaxLinks() === 1 && endPin.isConnected()) {
@@ -72,8 +142,8 @@ export class WiringController {
         if (!isExecPin && !typesMatch) {
             const convKey = Utils.getConversionNodeKey(startPin.type, endPin.type);
             if (convKey) {
-                const startPos = Utils.getPinPosition(startPin.element, this.app);
-                const endPos = Utils.getPinPosition(endPin.element, this.app);
+                const startPos = startPin.getPosition(this.app);
+                const endPos = endPin.getPosition(this.app);
                 const midX = (startPos.x + endPos.x) / 2;
                 const midY = (startPos.y + endPos.y) / 2;
                 const convNode = this.app.graph.addNode(convKey, midX - 40, midY - 15);
@@ -87,14 +157,12 @@ export class WiringController {
                     if (convIn && convOut) {
                         this._addLink(startPin, convIn);
                         this._addLink(convOut, endPin);
-                        this.updateVisuals(startPin.node);
-                        this.updateVisuals(convNode);
-                        this.updateVisuals(endPin.node);
-                        requestAnimationFrame(() => {
-                            this.app.graph.redrawNodeWires(startPin.node.id);
-                            this.app.graph.redrawNodeWires(convNode.id);
-                            this.app.graph.redrawNodeWires(endPin.node.id);
-                        });
+                        this.updateLinkVisuals(startPin.node);
+                        this.updateLinkVisuals(convNode);
+                        this.updateLinkVisuals(endPin.node);
+                        this.app.graph.scheduleRedraw(startPin.node.id);
+                        this.app.graph.scheduleRedraw(convNode.id);
+                        this.app.graph.scheduleRedraw(endPin.node.id);
                         this.app.persistence.autoSave();
                         this.app.compiler.markDirty();
                         return;
@@ -107,25 +175,83 @@ export class WiringController {
         }
 
         this._addLink(startPin, endPin);
-        this.updateVisuals(endPin.node);
-        this.updateVisuals(startPin.node);
-        requestAnimationFrame(() => {
-            this.app.graph.redrawNodeWires(endPin.node.id);
-            this.app.graph.redrawNodeWires(startPin.node.id);
+        this.updateLinkVisuals(endPin.node);
+        this.updateLinkVisuals(startPin.node);
+        this.app.graph.scheduleRedraw(endPin.node.id);
+        this.app.graph.scheduleRedraw(startPin.node.id);
+        this.app.persistence.autoSave();
+        this.app.compiler.markDirty();
+    }
+
+    /**
+     * Connects many pin pairs at once (e.g. the internal links of a
+     * duplicated selection). Links are added directly, then each touched
+     * node is refreshed and queued for redraw once, with a single
+     * autoSave/markDirty, instead of once per createConnection call.
+     * Pairs whose types differ go through createConnection, which may
+     * insert a conversion node.
+     * @param {Array<Array<Pin>>} pairs - The [pinA, pinB] pairs to connect.
+     */
+    bulkConnect(pairs) {
+        const touchedNodes = new Set();
+        for (const [pinA, pinB] of pairs) {
+            if (!pinA || !pinB) continue;
+            const startPin = pinA.dir === 'out' ? pinA : pinB;
+            const endPin = pinA.dir === 'in' ? pinA : pinB;
+
+            const isExecPin = startPin.type === 'exec' || endPin.type === 'exec';
+            if (!isExecPin && startPin.type !== endPin.type) {
+                this.createConnection(startPin, endPin);
+                continue;
+            }
+            if (this._linkExists(startPin, endPin)) continue;
+
+            // Break existing connection if input pin is single-link
+            if (endPin.getMaxLinks() === 1 && endPin.isConnected()) {
+                this.breakPinLinks(endPin.id);
+            }
+            this._addLink(startPin, endPin);
+            touchedNodes.add(startPin.node);
+            touchedNodes.add(endPin.node);
+        }
+        if (touchedNodes.size === 0) return;
+
+        touchedNodes.forEach(node => {
+            this.updateLinkVisuals(node);
+            this.app.graph.scheduleRedraw(node.id);
         });
         this.app.persistence.autoSave();
         this.app.compiler.markDirty();
     }
 
+    _linkExists(startPin, endPin) {
+        for (const linkId of startPin.links) {
+            const link = this.links.get(linkId);
+            if (link && link.endPin.id === endPin.id) return true;
+        }
+        return false;
+    }
+
     _addLink(startPin, endPin) {
         const link = {
             id: Utils.uniqueId('link'),
             startPin: startPin,
             endPin: endPin,
         };
-        this.links.set(link.id, link);
-        startPin.links.push(link.id);
-        endPin.links.push(link.id);
+        this.registerLink(link);
+        startPin.links.add(link.id);
+        endPin.links.add(link.id);
+    }
+
+    /**
+     * Refreshes a node after its links changed. Only the connected state of
+     * its pins differs, so they are updated in place; updateVisuals (a full
+     * re-render) is kept for structural changes such as new pins or types.
+     * @param {Node} node - The node whose links changed.
+     */
+    updateLinkVisuals(node) {
+        if (!node || !node.element || !node.element.isConnected) return;
+        node.updateConnectedState();
     }
 
     updateVisuals(node) {
@@ -151,29 +277,24 @@ export class WiringController {
         if (!link) return;
         const { startPin, endPin } = link;
 
-        if (startPin && startPin.links) {
-            startPin.links = startPin.links.filter(id => id !== linkId);
-        }
-        if (endPin && endPin.links) {
-            endPin.links = endPin.links.filter(id => id !== linkId);
-        }
+        if (startPin && startPin.links) startPin.links.delete(linkId);
+        if (endPin && endPin.links) endPin.links.delete(linkId);
 
-        this.links.delete(linkId);
+        this.unregisterLink(link);
         this.selectedLinks.delete(linkId);
-        const wireEl = document.getElementById(link.id);
+        const { wireEl } = link;
         if (wireEl && wireEl.parentNode) {
             wireEl.remove();
         }
+        link.wireEl = null;
 
-        if (endPin) this.updateVisuals(endPin.node);
-        if (startPin) this.updateVisuals(startPin.node);
+        if (endPin) this.updateLinkVisuals(endPin.node);
+        if (startPin) this.updateLinkVisuals(startPin.node);
 
-        requestAnimationFrame(() => {
-            if (endPin) this.app.graph.redrawNodeWires(endPin.node.id);
-            if (startPin) this.app.graph.redrawNodeWires(startPin.node.id);
-            this.app.persistence.autoSave();
-            this.app.compiler.markDirty();
-        });
+        if (endPin) this.app.graph.scheduleRedraw(endPin.node.id);
+        if (startPin) this.app.graph.scheduleRedraw(startPin.node.id);
+        this.app.persistence.autoSave();
+        this.app.compiler.markDirty();
     }
 
     breakPinLinks(pinId) {
@@ -181,7 +302,49 @@ export class WiringController {
         linksToBreak.map(l => l.id).forEach(linkId => this.breakLinkById(linkId));
     }
 
-    drawWire(link) {
+    /**
+     * Queues every wire of a node for redraw on the next animation frame.
+     * A wire queued many times before then (e.g. by 120Hz mouse events, or
+     * through both of its nodes) is drawn only once.
+     * @param {string} nodeId - The node ID whose wires to redraw.
+     */
+    markNodeWiresDirty(nodeId) {
+        const linkIds = this.linksByNode.get(nodeId);
+        if (!linkIds) return;
+        linkIds.forEach(id => this.dirtyLinks.add(id));
+        this.scheduleFlush();
+    }
+
+    scheduleFlush() {
+        if (this.flushScheduled) return;
+        this.flushScheduled = true;
+        requestAnimationFrame(() => {
+            this.flushScheduled = false;
+            this.flushDirtyWires();
+        });
+    }
+
+    /** Draws every queued wire now; links broken since they were queued are skipped. */
+    flushDirtyWires() {
+        if (this.dirtyLinks.size === 0) return;
+        // Pin positions are measured against the applied pan/zoom
+        this.app.graph.forceTransformFlush();
+        const linkIds = [...this.dirtyLinks];
+        this.dirtyLinks.clear();
+        const view = this.app.graph.getViewportBounds();
+        for (const id of linkIds) {
+            const link = this.links.get(id);
+            if (link) this.drawWire(link, view);
+        }
+    }
+
+    /**
+     * Draws (or hides, when off-screen) one link's wire.
+     * @param {Object} link - The link ({ id, startPin, endPin }).
+     * @param {Object|null} view - Viewport bounds from getViewportBounds, for
+     *   callers drawing many wires that computed them once.
+     */
+    drawWire(link, view = this.app.graph.getViewportBounds()) {
         const { startPin, endPin } = link;
 
         if (!startPin.element || !endPin.element || !startPin.element.isConnected || !endPin.element.isConnected) {
@@ -191,32 +354,62 @@ export class WiringController {
             return;
         }
 
-        let wireEl = document.getElementById(link.id);
+        // The path is kept on the link, so it is never looked up by id
+        let wireEl = link.wireEl;
         if (!wireEl) {
             wireEl = document.createElementNS('http://www.w3.org/2000/svg', 'path');
             wireEl.id = link.id;
             this.svgGroup.appendChild(wireEl);
-            wireEl.addEventListener('click', (e) => {
-                e.stopPropagation();
-                this.toggleLinkSelection(link.id);
-            });
+            link.wireEl = wireEl;
+            link.wirePath = null;
         } else {
             wireEl.style.display = '';
         }
 
-        const pinColor = Utils.getPinColor(startPin.type);
-        wireEl.setAttribute('stroke', pinColor);
+        const p1 = startPin.getPosition(this.app);
+        const p2 = endPin.getPosition(this.app);
+        // Skip the DOM writes for wires entirely outside the view; the pan/zoom
+        // and resize handlers redraw all wires, which brings them back
+        if (this.isWireOffscreen(p1, p2, view)) {
+            wireEl.style.display = 'none';
+            return;
+        }
+
+        wireEl.setAttribute('stroke', startPin.color);
+        wireEl.setAttribute('class', `wire ${startPin.typeClass} ${this.selectedLinks.has(link.id) ? 'link-selected' : ''}`);
+        // Static wires redrawn while panning keep the same path; skip the
+        // attribute write (and its re-parse) when nothing changed
+        const path = Utils.getWirePath(p1.x, p1.y, p2.x, p2.y);
+        if (path !== link.wirePath) {
+            wireEl.setAttribute('d', path);
+            link.wirePath = path;
+        }
+    }
 
-        const typeClass = Utils.getPinTypeClass(startPin.type);
-        wireEl.setAttribute('class', `wire ${typeClass} ${this.selectedLinks.has(link.id) ? 'link-selected' : ''}`);
-        const p1 = Utils.getPinPosition(startPin.element, this.app);
-        const p2 = Utils.getPinPosition(endPin.element, this.app);
-        wireEl.setAttribute('d', Utils.getWirePath(p1.x, p1.y, p2.x, p2.y));
+    /**
+     * Checks whether a wire between two graph-space points lies entirely
+     * outside the visible viewport. The bezier stays inside the box of its
+     * control points, which reach at least 50 units past each end horizontally.
+     * @param {{x: number, y: number}} p1 - Start point.
+     * @param {{x: number, y: number}} p2 - End point.
+     * @param {Object|null} view - Viewport bounds (see GraphController.getViewportBounds).
+     * @returns {boolean} True if the wire cannot be visible.
+     */
+    isWireOffscreen(p1, p2, view) {
+        if (!view) return false;
+        const reach = Math.max(Math.abs(p2.x - p1.x) * 0.5, 50) + WIRE_CULL_MARGIN;
+        return (
+            Math.max(p1.x, p2.x) + reach < view.left ||
+            Math.min(p1.x, p2.x) - reach > view.right ||
+            Math.max(p1.y, p2.y) + WIRE_CULL_MARGIN < view.top ||
+            Math.min(p1.y, p2.y) - WIRE_CULL_MARGIN > view.bottom
+        );
     }
 
     updateGhostWire(e, startPin) {
         if (!startPin || !startPin.element) {
             this.ghostWire.style.display = 'none';
+            this.lastGhost = null;
             return;
         }
         this.ghostWire.style.display = 'block';
@@ -225,16 +418,17 @@ export class WiringController {
         }
         this.ghostWire.style.strokeWidth = '3px';
         this.ghostWire.style.opacity = '1';
-        const typeClass = Utils.getPinTypeClass(startPin.type);
-        this.ghostWire.setAttribute('class', `wire ${typeClass}`);
-        const pinColor = Utils.getPinColor(startPin.type);
-        this.ghostWire.setAttribute('stroke', pinColor);
-        const p1 = Utils.getPinPosition(startPin.element, this.app);
+        this.ghostWire.setAttribute('class', `wire ${startPin.typeClass}`);
+        this.ghostWire.setAttribute('stroke', startPin.color);
+        const p1 = startPin.getPosition(this.app);
         const p2 = this.app.graph.getGraphCoords(e.clientX, e.clientY);
         const startX = startPin.dir === 'out' ? p1.x : p2.x;
         const startY = startPin.dir === 'out' ? p1.y : p2.y;
         const endX = startPin.dir === 'out' ? p2.x : p1.x;
         const endY = startPin.dir === 'out' ? p2.y : p1.y;
+        const last = this.lastGhost;
+        if (last && last.x1 === startX && last.y1 === startY && last.x2 === endX && last.y2 === endY) return;
+        this.lastGhost = { x1: startX, y1: startY, x2: endX, y2: endY };
         this.ghostWire.setAttribute('d', Utils.getWirePath(startX, startY, endX, endY));
     }
 
@@ -4,6 +4,7 @@
  * WiringController has been extracted to WiringController.js
  * SelectionController has been extracted to SelectionController.js
  * InputController has been extracted to InputController.js
+ * NodeSpatialIndex (marquee hit-testing) lives in NodeSpatialIndex.js
  * This file now manages the GraphController and core graph operations.
  */
 import { Utils } from '../../shared/utils.js';
@@ -11,11 +12,16 @@ import { nodeRegistry } from '../registries/NodeRegistry.js';
 import { WiringController } from './WiringController.js';
 import { SelectionController } from './SelectionController.js';
 import { InputController } from './InputController.js';
+import { NodeSpatialIndex } from './NodeSpatialIndex.js';
+import { SCHEMA_DELEGATE_PIN_REMOVED } from '../services/HistoryManager.js';
 import { Pin, Node } from './Node.js';
 
 // Re-export for compatibility
 export { Pin, Node };
 
+// Fields the Node constructor reads from its node data (besides pins)
+const NODE_DATA_FIELDS = ['title', 'type', 'icon', 'devWarning', 'variableType', 'variableId', 'customData'];
+
 class GraphController {
     constructor(editor, svg, nodesContainer, app) {
         this.editor = editor;
@@ -23,15 +29,35 @@ class GraphController {
         this.nodesContainer = nodesContainer;
         this.app = app;
         this.nodes = new Map();
+        // Node positions as parallel arrays indexed by each node's slot, so
+        // moving many nodes writes into two flat buffers. Slots are assigned
+        // by allocNodeSlot; Node.x/y read and write through them.
+        this.posX = new Float64Array(64);
+        this.posY = new Float64Array(64);
+        this.slotCount = 0;
         this.zoomReadout = document.getElementById('zoom-readout');
         this.pan = { x: 0, y: 0 };
         this.zoom = 1;
         this.isEditingLiteral = false;
         this.graphPanel = editor; // Alias for compatibility
+        // Editor size in screen pixels, kept current by a ResizeObserver
+        // (0 until the first observation, which disables wire culling)
+        this.viewportWidth = 0;
+        this.viewportHeight = 0;
+        // Nodes whose element transforms are written on the next animation frame
+        this.pendingPositionNodes = new Set();
+        this.positionUpdateScheduled = false;
+        // Set while a pan/zoom transform waits for the next animation frame
+        this.transformPending = false;
+        // Pan/zoom the DOM currently shows, to skip flushes that change nothing
+        this.appliedTransform = { x: NaN, y: NaN, zoom: NaN };
+        // Editor's client rect, reused across mouse events (see getEditorRect)
+        this.editorRect = null;
         
         // Delegate to extracted controllers
         this.selection = new SelectionController(this);
         this.input = new InputController(this);
+        this.spatialIndex = new NodeSpatialIndex(this);
         
         // Backwards compatibility: expose selectedNodes as a getter
         Object.defineProperty(this, 'selectedNodes', {
@@ -46,6 +72,11 @@ class GraphController {
      * Binds mouse, wheel, drag, and keyboard events.
      */
     initEvents() {
+        // Measure the editor once per interaction; scrolling or resizing the
+        // page moves it, so drop the cached rect on those events
+        this.editor.addEventListener('pointerdown', () => this.editorRect = this.editor.getBoundingClientRect());
+        window.addEventListener('scroll', () => this.editorRect = null, true);
+        window.addEventListener('resize', () => this.editorRect = null);
         this.editor.addEventListener('mousedown', (e) => this.input.handleEditorMouseDown(e));
         this.editor.addEventListener('wheel', (e) => this.input.handleZoom(e));
         this.editor.addEventListener('contextmenu', (e) => this.input.handleContextMenu(e));
@@ -53,6 +84,56 @@ class GraphController {
         this.editor.addEventListener('dragover', this.handleDragOver.bind(this));
         this.editor.addEventListener('drop', this.handleDrop.bind(this));
         document.addEventListener('keydown', (e) => this.input.handleKeyDown(e));
+
+        // Track the editor size for wire culling; wires hidden while outside
+        // the old bounds may be visible in the new ones
+        this.resizeObserver = new ResizeObserver((entries) => {
+            const { width, height } = entries[0].contentRect;
+            this.viewportWidth = width;
+            this.viewportHeight = height;
+            this.editorRect = null;
+            this.drawAllWires();
+        });
+        this.resizeObserver.observe(this.editor);
+    }
+
+    /**
+     * Returns the visible part of the graph in graph coordinates, or null
+     * while the editor size is not yet known.
+     * @returns {{left: number, top: number, right: number, bottom: number}|null} The bounds.
+     */
+    getViewportBounds() {
+        if (!this.viewportWidth || !this.viewportHeight) return null;
+        return {
+            left: -this.pan.x / this.zoom,
+            top: -this.pan.y / this.zoom,
+            right: (this.viewportWidth - this.pan.x) / this.zoom,
+            bottom: (this.viewportHeight - this.pan.y) / this.zoom,
+        };
+    }
+
+    /**
+     * Reserves a position slot for a node. When the buffers are full, the
+     * slots of live nodes are packed to the front first (dropping those of
+     * deleted nodes), and the buffers double only if that frees too little.
+     * @returns {number} The slot index into posX/posY.
+     */
+    allocNodeSlot() {
+        if (this.slotCount >= this.posX.length) {
+            const live = [...this.nodes.values()];
+            const capacity = live.length * 2 >= this.posX.length ? this.posX.length * 2 : this.posX.length;
+            const posX = new Float64Array(capacity);
+            const posY = new Float64Array(capacity);
+            live.forEach((node, slot) => {
+                posX[slot] = this.posX[node.slot];
+                posY[slot] = this.posY[node.slot];
+                node.slot = slot;
+            });
+            this.posX = posX;
+            this.posY = posY;
+            this.slotCount = live.length;
+        }
+        return this.slotCount++;
     }
 
     handleDragOver(e) { e.preventDefault(); e.dataTransfer.dropEffect = 'copy'; }
@@ -220,7 +301,8 @@ class GraphController {
             });
         }
 
-        // Duplicate internal connections
+        // Duplicate internal connections, collected and connected in one batch
+        const newLinkPairs = [];
         for (const link of this.app.wiring.links.values()) {
             const startNodeIsSelected = this.selectedNodes.has(link.startPin.node.id);
             const endNodeIsSelected = this.selectedNodes.has(link.endPin.node.id);
@@ -234,11 +316,12 @@ class GraphController {
                     const newEndPin = this.findPinById(newEndPinId);
 
                     if (newStartPin && newEndPin && this.canConnect(newStartPin, newEndPin)) {
-                        this.app.wiring.createConnection(newStartPin, newEndPin);
+                        newLinkPairs.push([newStartPin, newEndPin]);
                     }
                 }
             }
         }
+        this.app.wiring.bulkConnect(newLinkPairs);
 
         this.app.wiring.clearLinkSelection();
         this.clearSelection();
@@ -249,28 +332,16 @@ class GraphController {
 
     findPinById(pinId) {
         if (!pinId) return null;
-        // The format is usually 'node-id-part1-pinName'
-        const parts = pinId.split('-');
-        if (parts.length < 2) return null;
-
-        // Find the node ID part, which could be 'node-XXXX' or similar
-        // We try to reconstruct the Node ID by iterating from the end
-        let nodeId = parts[0];
-        const pinName = parts.slice(1).join('-');
-
-        // Assuming node IDs are 'node-UUID' where UUID is 8 characters (or just UUID if the 'node-' prefix is removed)
-        // More robust: search for a node ID that is a prefix of pinId
-        const nodeIds = Array.from(this.nodes.keys());
-
-        for (const id of nodeIds) {
-            if (pinId.startsWith(id)) {
-                nodeId = id;
-                break;
-            }
+        // The format is 'nodeId-pinName', and node ids contain dashes too
+        // ('node-XXXX'), so try each dash as the split point: a few Map
+        // lookups instead of scanning every node id for a prefix match.
+        // A shorter id can prefix a longer one ('node-1', 'node-1-2'), so a
+        // node without the pin does not end the search
+        for (let dash = pinId.indexOf('-'); dash !== -1; dash = pinId.indexOf('-', dash + 1)) {
+            const pin = this.nodes.get(pinId.slice(0, dash))?.findPinById(pinId);
+            if (pin) return pin;
         }
-
-        const node = this.nodes.get(nodeId);
-        return node ? node.findPinById(pinId) : null;
+        return null;
     }
 
     /**
@@ -289,7 +360,7 @@ class GraphController {
         const endPin = pinA.dir === 'in' ? pinA : pinB;
 
         // If the end pin already has max links, prevent connection
-        if (endPin.links.length >= endPin.getMaxLinks()) return false;
+        if (endPin.links.size >= endPin.getMaxLinks()) return false;
 
         // Check container type match (single, array, set, map)
         if (startPin.containerType !== endPin.containerType) return false;
@@ -316,7 +387,7 @@ class GraphController {
         }
 
         // Calculate position offset relative to the pin's center
-        const pinPos = Utils.getPinPosition(pin.element, this.app);
+        const pinPos = pin.getPosition(this.app);
         const x = pinPos.x - 10;
         const y = pinPos.y - 15;
 
@@ -371,6 +442,34 @@ class GraphController {
         node.variableId = template.variableId;
         node.customData = template.customData || {};
 
+        // Fast path: the template still has the same pins in the same order,
+        // so update the existing Pin objects in place. Their links, literals
+        // and elements stay valid and nothing needs to be reallocated.
+        const templatePins = template.pins;
+        const samePins = node.pins.length === templatePins.length &&
+            node.pins.every((oldPin, i) => {
+                const pinId = templatePins[i].id;
+                return oldPin.id === (pinId.includes(node.id) ? pinId : `${node.id}-${pinId}`);
+            });
+
+        if (samePins) {
+            node.pins.forEach((pin, i) => {
+                const pData = templatePins[i];
+                pin.name = pData.name;
+                pin.type = (pData.type || '').toLowerCase();
+                pin.dir = pData.dir;
+                pin.containerType = pData.containerType || 'single';
+                pin.defaultValue = pData.defaultValue !== undefined ? pData.defaultValue : pin.getDefaultValue();
+                pin.isCustom = pData.isCustom || false;
+            });
+
+            node.refreshPinCache();
+            this.app.wiring.updateVisuals(node);
+            this.redrawNodeWires(node.id);
+            return;
+        }
+
+        // Structural change: rebuild the pins, matching old ones by full id
         const oldPinsMap = new Map(node.pins.map(p => [p.id, p]));
         const oldLiterals = new Map(node.pinLiterals);
 
@@ -477,25 +576,24 @@ class GraphController {
     }
 
     selectNodesInRect(rect, mode) {
-        for (const node of this.nodes.values()) {
-            const nodeRect = node.element.getBoundingClientRect();
-            // Check if node rect intersects with selection rect
-            const intersects = (
-                nodeRect.left < rect.right &&
-                nodeRect.right > rect.left &&
-                nodeRect.top < rect.bottom &&
-                nodeRect.bottom > rect.top
-            );
-
-            if (intersects) {
-                // Marquee selects the node
-                this.selectNode(node.id, true, mode);
-            } else if (mode === 'new') {
-                // In 'new' mode, if it doesn't intersect, ensure it's unselected
-                this.selectedNodes.delete(node.id);
-                node.element.classList.remove('selected');
+        // Convert the screen-space marquee to graph space once, then test
+        // only the nodes in the grid cells it covers
+        const topLeft = this.getGraphCoords(rect.left, rect.top);
+        const bottomRight = this.getGraphCoords(rect.right, rect.bottom);
+        const hits = this.spatialIndex.query(topLeft.x, topLeft.y, bottomRight.x, bottomRight.y);
+
+        if (mode === 'new') {
+            // In 'new' mode, unselect the selected nodes the marquee missed
+            for (const nodeId of [...this.selectedNodes]) {
+                const node = this.nodes.get(nodeId);
+                if (node && !hits.has(node)) {
+                    this.selectedNodes.delete(nodeId);
+                    node.element.classList.remove('selected');
+                }
             }
         }
+        // Marquee selects the nodes it intersects
+        hits.forEach(node => this.selectNode(node.id, true, mode));
 
         // Re-run selectNode logic for the final set to ensure details panel is updated correctly
         if (this.selectedNodes.size === 1) {
@@ -538,25 +636,70 @@ class GraphController {
 
     snapSelectedNodesToGrid() {
         const gridSize = 10;
+        // Snap the positions in JS only; the DOM is written in one batch
         for (const nodeId of this.selectedNodes) {
             const node = this.nodes.get(nodeId);
-            if (node) {
-                node.x = Math.round(node.x / gridSize) * gridSize;
-                node.y = Math.round(node.y / gridSize) * gridSize;
-                node.element.style.left = `${node.x}px`;
-                node.element.style.top = `${node.y}px`;
-                this.redrawNodeWires(node.id);
-            }
+            if (!node) continue;
+            const x = Math.round(node.x / gridSize) * gridSize;
+            const y = Math.round(node.y / gridSize) * gridSize;
+            // Already-aligned nodes need neither a transform write nor a wire redraw
+            if (x === node.x && y === node.y) continue;
+            node.x = x;
+            node.y = y;
+            this.schedulePositionUpdate(node);
         }
     }
 
     /**
-     * Updates the CSS transform for pan and zoom.
+     * Queues a moved node's element transform for the next animation frame.
+     * That frame writes every queued transform first and then redraws the
+     * affected wires, each once, so DOM writes are not interleaved with the
+     * layout reads made while drawing wires.
+     * @param {Node} node - The node whose x/y changed.
+     */
+    schedulePositionUpdate(node) {
+        this.pendingPositionNodes.add(node);
+        if (this.positionUpdateScheduled) return;
+        this.positionUpdateScheduled = true;
+        requestAnimationFrame(() => {
+            this.positionUpdateScheduled = false;
+            const nodes = [...this.pendingPositionNodes];
+            this.pendingPositionNodes.clear();
+            nodes.forEach(n => n.applyPosition());
+            nodes.forEach(n => this.redrawNodeWires(n.id));
+            // Draw in this frame rather than waiting for the next one
+            this.app.wiring.flushDirtyWires();
+        });
+    }
+
+    /**
+     * Updates the CSS transform for pan and zoom on the next animation frame.
      */
     updateTransform() {
-        const transform = `translate(${this.pan.x}px, ${this.pan.y}px) scale(${this.zoom})`;
+        // Pan/zoom can fire many times per frame; apply only the latest state once
+        if (this.transformPending) return;
+        this.transformPending = true;
+        requestAnimationFrame(() => this.forceTransformFlush());
+    }
+
+    /**
+     * Applies a pending pan/zoom transform now instead of on the next frame,
+     * for callers that read layout depending on it. Does nothing when no
+     * transform is pending.
+     */
+    forceTransformFlush() {
+        if (!this.transformPending) return;
+        this.transformPending = false;
+        const { x, y } = this.pan;
+        const zoom = this.zoom;
+        const applied = this.appliedTransform;
+        if (applied.x === x && applied.y === y && applied.zoom === zoom) return;
+        applied.x = x;
+        applied.y = y;
+        applied.zoom = zoom;
+        const transform = `translate(${x}px, ${y}px) scale(${zoom})`;
         this.nodesContainer.style.transform = transform;
-        const svgTransform = `translate(${this.pan.x}, ${this.pan.y}) scale(${this.zoom})`;
+        const svgTransform = `translate(${x}, ${y}) scale(${zoom})`;
         this.app.wiring.svgGroup.setAttribute('transform', svgTransform);
         this.app.grid.draw();
         // Redraw wires on transform update to ensure ghost wire is correctly positioned during pan/zoom
@@ -564,20 +707,42 @@ class GraphController {
     }
 
     /**
-     * Redraws all wires connected to a specific node.
+     * Redraws all wires connected to a specific node on the next animation
+     * frame (see WiringController.markNodeWiresDirty).
      * @param {string} nodeId - The node ID whose wires to redraw.
      */
     redrawNodeWires(nodeId) {
-        this.app.wiring.findLinksByNodeId(nodeId).forEach(link => this.app.wiring.drawWire(link));
+        this.app.wiring.markNodeWiresDirty(nodeId);
+    }
+
+    /**
+     * Queues a node's wires for redraw on the next animation frame.
+     * Kept as the name used by drag and edit handlers; same as redrawNodeWires.
+     * @param {string} nodeId - The node ID whose wires to redraw.
+     */
+    scheduleRedraw(nodeId) {
+        this.redrawNodeWires(nodeId);
     }
 
     /**
      * Redraws all wire connections in the graph.
      */
     drawAllWires() {
-        // Find all wires and ensure they are redrawn
-        for (const link of this.app.wiring.links.values()) {
-            this.app.wiring.drawWire(link);
+        const wiring = this.app.wiring;
+        const group = wiring.svgGroup;
+        const parent = group.parentNode;
+        const next = group.nextSibling;
+        // Take the wire group out of the document while rewriting its paths,
+        // so the writes invalidate layout once (on re-insertion), not per wire
+        if (parent) parent.removeChild(group);
+        try {
+            // One viewport for the whole pass; off-screen wires are culled in drawWire
+            const view = this.getViewportBounds();
+            for (const link of wiring.links.values()) {
+                wiring.drawWire(link, view);
+            }
+        } finally {
+            if (parent) parent.insertBefore(group, next);
         }
     }
 
@@ -585,10 +750,21 @@ class GraphController {
      * Renders all nodes in the graph to the DOM.
      */
     renderAllNodes() {
-        this.nodesContainer.innerHTML = '';
+        // Build the nodes off-DOM and swap them in with a single insertion
+        const fragment = document.createDocumentFragment();
         for (const node of this.nodes.values()) {
-            this.nodesContainer.appendChild(node.render());
+            fragment.appendChild(node.render());
         }
+        this.nodesContainer.replaceChildren(fragment);
+    }
+
+    /**
+     * Returns the editor's client rect, measuring it only when the cached one
+     * was invalidated, so mousemove handlers do not force a layout each event.
+     * @returns {DOMRect} The editor's bounding client rect.
+     */
+    getEditorRect() {
+        return this.editorRect || (this.editorRect = this.editor.getBoundingClientRect());
     }
 
     /**
@@ -598,7 +774,7 @@ class GraphController {
      * @returns {{x: number, y: number}} Graph coordinates.
      */
     getGraphCoords(clientX, clientY) {
-        const rect = this.editor.getBoundingClientRect();
+        const rect = this.getEditorRect();
         const x = (clientX - rect.left - this.pan.x) / this.zoom;
         const y = (clientY - rect.top - this.pan.y) / this.zoom;
         return { x, y };
@@ -610,70 +786,100 @@ class GraphController {
         const safeNodes = safeState.nodes || [];
         const safeLinks = safeState.links || [];
 
-        // Clear existing state
-        this.nodes.clear();
-        this.app.wiring.links.clear();
+        // Clear existing state. Start from a fresh Map rather than clearing
+        // the old one; it is filled node by node below, so allocNodeSlot
+        // sees every loaded node as live while the rest are created
+        this.nodes = new Map();
+        this.spatialIndex.clear();
+        this.app.wiring.clearLinks();
         this.clearSelection();
         this.app.wiring.clearLinkSelection();
 
+        // Plain indexed loops with hoisted lookups: loads of large saves
+        // spend most of their time in these loops
+        const nodes = this.nodes;
+        const wiring = this.app.wiring;
+        // Legacy cleanups only run for states saved before they were needed;
+        // the next save writes the current version, so they run once per save
+        const schemaVersion = safeState.schemaVersion | 0;
+
         // 1. Load Nodes
-        safeNodes.forEach((nodeData) => {
-            const template = nodeRegistry.get(nodeData.nodeKey);
+        for (let i = 0; i < safeNodes.length; i++) {
+            const nodeData = safeNodes[i];
+            const { id, x, y, nodeKey } = nodeData;
+            let savedPins = nodeData.pins;
+            const template = nodeRegistry.get(nodeKey);
             if (!template) {
-                console.warn(`Skipping node during load: Key '${nodeData.nodeKey}' not found in NodeRegistry.`);
-                return;
+                console.warn(`Skipping node during load: Key '${nodeKey}' not found in NodeRegistry.`);
+                continue;
             }
 
             // Determine the final pin definition to use: saved pins (for dynamic nodes) or template pins (for static nodes)
             let pinsToLoad = template.pins;
 
-            // If the node is a Custom Event (or other dynamic node) AND saved pins exist
-            if (nodeData.nodeKey === 'CustomEvent') {
-                // Check if saved pins contains custom pins (more than the base exec/delegate pins)
-                const hasCustomPins = nodeData.pins && nodeData.pins.some(p => p.isCustom);
-                if (hasCustomPins) {
-                    pinsToLoad = nodeData.pins;
+            // Only Custom Events have dynamic pins; every other node (function
+            // calls included) uses its template pins, with saved literals restored below
+            if (nodeKey === 'CustomEvent' && savedPins) {
+                // Drop the removed delegate output pin from older saves
+                if (schemaVersion < SCHEMA_DELEGATE_PIN_REMOVED) {
+                    savedPins = savedPins.filter(p => p.id !== 'delegate_out' && p.name !== 'Output Delegate');
+                }
+                // Use the saved pins if they contain custom pins (more than the base exec pin)
+                if (savedPins.some(p => p.isCustom)) {
+                    pinsToLoad = savedPins;
                 }
-            } else if (nodeData.nodeKey.startsWith('Func_') && nodeData.pins) {
-                // Function call pins may change. We should handle merging the template and saved pins if needed, 
-                // but for simplicity here, we assume if we have saved pins, we use them to restore literal values/structure if dynamic.
             }
 
-            const fullNodeData = { ...template, ...nodeData, pins: pinsToLoad };
-            const node = new Node(nodeData.id, fullNodeData, nodeData.x, nodeData.y, nodeData.nodeKey, this.app);
-            this.nodes.set(node.id, node);
+            // Copy only the fields Node reads, saved values overriding the
+            // template's as a spread would, instead of every template field;
+            // the fixed key order also gives every node data object one shape
+            const fullNodeData = { pins: pinsToLoad };
+            for (const key of NODE_DATA_FIELDS) {
+                fullNodeData[key] = key in nodeData ? nodeData[key] : template[key];
+            }
+            const node = new Node(id, fullNodeData, x, y, nodeKey, this.app);
+            nodes.set(node.id, node);
 
             // Restore literal values
-            if (nodeData.pins) {
-                nodeData.pins.forEach(savedPin => {
+            if (savedPins) {
+                const prefix = `${node.id}-`;
+                const pinLiterals = node.pinLiterals;
+                for (let j = 0; j < savedPins.length; j++) {
+                    const savedPin = savedPins[j];
                     // Normalize saved pin ID to match the runtime Pin ID format
-                    const fullPinId = savedPin.id.includes(node.id) ? savedPin.id : `${node.id}-${savedPin.id}`;
+                    const fullPinId = savedPin.id.startsWith(prefix) ? savedPin.id : prefix + savedPin.id;
                     const pin = node.findPinById(fullPinId);
 
                     if (pin && savedPin.literalValue !== undefined) {
-                        node.pinLiterals.set(pin.id, savedPin.literalValue);
+                        pinLiterals.set(pin.id, savedPin.literalValue);
                     } else if (pin) {
                         // Ensure a default is set if literalValue was missing or undefined
-                        node.pinLiterals.set(pin.id, pin.defaultValue);
+                        pinLiterals.set(pin.id, pin.defaultValue);
                     }
-                });
+                }
             }
-        });
+        }
 
         // 2. Load Links
-        safeLinks.forEach(linkData => {
-            const startPin = this.findPinById(linkData.startPinId);
-            const endPin = this.findPinById(linkData.endPinId);
+        // Index every loaded pin once, so each link end is a single Map lookup
+        // rather than a findPinById that splits the id to find the node
+        const pinIndex = new Map();
+        for (const node of nodes.values()) {
+            for (const pin of node.pins) pinIndex.set(pin.id, pin);
+        }
+        for (let i = 0; i < safeLinks.length; i++) {
+            const { id, startPinId, endPinId } = safeLinks[i];
+            const startPin = pinIndex.get(startPinId);
+            const endPin = pinIndex.get(endPinId);
 
             if (startPin && endPin) {
-                const link = { id: linkData.id, startPin, endPin };
-                this.app.wiring.links.set(link.id, link);
-                startPin.links.push(link.id);
-                endPin.links.push(link.id);
+                wiring.registerLink({ id, startPin, endPin });
+                startPin.links.add(id);
+                endPin.links.add(id);
             } else {
-                console.warn(`Skipping link during load due to missing pin: ${linkData.id}`);
+                console.warn(`Skipping link during load due to missing pin: ${id}`);
             }
-        });
+        }
 
         // 3. Render and Redraw
         // The second CRITICAL APP INITIALIZATION ERROR trace points to a failure related to 'renderAllNodes'.
@@ -685,7 +891,8 @@ class GraphController {
         if (safeState.pan) this.pan = safeState.pan;
         if (safeState.zoom) this.zoom = safeState.zoom;
         this.updateTransform();
+        this.forceTransformFlush();
     }
 }
 
-export { Pin, Node, WiringController, GraphController };
\ No newline at end of file
+export { WiringController, GraphController };
\ No newline at end of file
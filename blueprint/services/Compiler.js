@@ -19,6 +19,7 @@ export class Compiler {
         // Queue to store variable renames that haven't been applied to the graph yet
         this.pendingRenames = [];
         this.isDirty = false;
+        this.dirtyUpdateQueued = false;
     }
 
     /**
@@ -43,9 +44,24 @@ export class Compiler {
         this.markDirty();
     }
 
-    /** Marks the graph as needing compilation. */
+    /**
+     * Marks the graph as needing compilation.
+     * The flag is set at once; the toolbar update is queued as one microtask,
+     * so a burst of edits (e.g. breaking every link on a pin) touches the DOM once.
+     */
     markDirty() {
         this.isDirty = true;
+        if (this.dirtyUpdateQueued) return;
+        this.dirtyUpdateQueued = true;
+        queueMicrotask(() => {
+            this.dirtyUpdateQueued = false;
+            // A compile may have run since the edit
+            if (this.isDirty) this.showDirtyStatus();
+        });
+    }
+
+    /** Shows the dirty state on the toolbar status and compile button. */
+    showDirtyStatus() {
         if (this.statusElement) {
             this.statusElement.textContent = "Status: Dirty (Needs Compile)";
             this.statusElement.style.color = "#ffaa00";
@@ -3,6 +3,16 @@
  * Extracted from services.js for code complexity reduction.
  */
 
+// Versions of the saved state format. Each migration gets its own constant,
+// which loaders compare against, so raising STATE_SCHEMA_VERSION for the
+// next migration leaves the earlier cutoffs where they were.
+
+/** CustomEvent pins no longer include the legacy 'delegate_out' pin. */
+export const SCHEMA_DELEGATE_PIN_REMOVED = 2;
+
+/** Version written with every state: that of the latest migration. */
+export const STATE_SCHEMA_VERSION = SCHEMA_DELEGATE_PIN_REMOVED;
+
 /**
  * Manages the history stack for undo/redo and handles application state persistence.
  */
@@ -30,6 +40,7 @@ export class HistoryManager {
         const variablesArray = (this.app.variables && this.app.variables.variables) ? [...this.app.variables.variables.values()] : [];
 
         const state = {
+            schemaVersion: STATE_SCHEMA_VERSION,
             nodes: nodesArray.map(node => ({
                 id: node.id, title: node.title, x: node.x, y: node.y,
                 type: node.type, nodeKey: node.nodeKey, icon: node.icon,
@@ -71,7 +82,7 @@ export class HistoryManager {
             const state = JSON.parse(stateJSON);
 
             if (this.app.graph && this.app.graph.nodes) this.app.graph.nodes.clear();
-            if (this.app.wiring && this.app.wiring.links) this.app.wiring.links.clear();
+            if (this.app.wiring && this.app.wiring.links) this.app.wiring.clearLinks();
             if (this.app.variables && this.app.variables.variables) this.app.variables.variables.clear();
 
             if (this.app.graph && this.app.graph.nodesContainer) this.app.graph.nodesContainer.innerHTML = '';
@@ -10,16 +10,29 @@ export class Persistence {
     constructor(app, storageKey = 'blueprintGraph_v3') {
         this.storageKey = storageKey;
         this.timeoutId = null;
+        this.saveQueued = false;
+        this.pendingAction = 'change';
         this.app = app;
     }
 
-    /** Saves the graph with a small delay to bundle quick changes. */
+    /**
+     * Saves the graph with a small delay to bundle quick changes.
+     * Calls in the same burst (e.g. a link break that also re-marks the
+     * compiler dirty) are coalesced in one microtask, so the save timer is
+     * reset once per burst instead of once per call.
+     */
     autoSave(actionType = 'change') {
-        if (this.timeoutId) clearTimeout(this.timeoutId);
-        this.timeoutId = setTimeout(() => {
-            this.app.history.saveState(actionType);
-            this.timeoutId = null;
-        }, 500);
+        this.pendingAction = actionType;
+        if (this.saveQueued) return;
+        this.saveQueued = true;
+        queueMicrotask(() => {
+            this.saveQueued = false;
+            if (this.timeoutId) clearTimeout(this.timeoutId);
+            this.timeoutId = setTimeout(() => {
+                this.timeoutId = null;
+                this.app.history.saveState(this.pendingAction);
+            }, 500);
+        });
     }
 
     /** Serializes the latest state from history and saves it to localStorage. */
@@ -70,7 +83,7 @@ export class Persistence {
             this.app.graph.nodesContainer.innerHTML = '';
         }
         if (this.app.wiring) {
-            this.app.wiring.links.clear();
+            this.app.wiring.clearLinks();
             if (this.app.wiring.svgGroup) {
                 this.app.wiring.svgGroup.innerHTML = '<path id="ghost-wire" class="wire" style="pointer-events: none;"></path>';
             }
@@ -91,7 +91,7 @@ export class SimulationEngine {
                 break;
             }
 
-            const linkId = outPin.links[0];
+            const linkId = outPin.links.values().next().value;
             const link = this.app.wiring.links.get(linkId);
 
             if (link) {
@@ -148,7 +148,7 @@ export class SimulationEngine {
         if (!pin) return null;
 
         if (pin.isConnected()) {
-            const linkId = pin.links[0];
+            const linkId = pin.links.values().next().value;
             const link = this.app.wiring.links.get(linkId);
             const sourcePin = link.startPin;
             const sourceNode = sourcePin.node;
@@ -668,6 +668,9 @@ export class DetailsController {
                 const titleEl = node.element.querySelector('.node-title span:last-child');
                 if (titleEl) {
                     titleEl.textContent = node.title;
+                    // The title can change the node's width, moving its output pins
+                    node.invalidateLayout();
+                    this.app.graph.scheduleRedraw(node.id);
                 }
                 this.app.persistence.autoSave();
             });
@@ -300,11 +300,7 @@ export class VariableController {
             // Optimized: Only redraw wires for affected nodes instead of all wires
             if (affectedNodes.length > 0) {
                 // Redraw wires for affected nodes
-                requestAnimationFrame(() => {
-                    affectedNodes.forEach(node => {
-                        this.app.graph.redrawNodeWires(node.id);
-                    });
-                });
+                affectedNodes.forEach(node => this.app.graph.scheduleRedraw(node.id));
             }
 
             this.app.palette.populateList();
@@ -1,9 +1,6 @@
+import mmap
 import re
 
-# Read the file
-with open('utils.js', 'r', encoding='utf-8') as f:
-    content = f.read()
-
 # Define category mappings based on node names
 category_map = {
     # String conversions
@@ -54,18 +51,32 @@ category_map = {
     'Comment': 'Development',
 }
 
-# For each node in the category map, add the category property
-for node_name, category in category_map.items():
-    # Pattern to match the node definition
-    pattern = rf'("{node_name}":\s*\{{\s*title:\s*"[^"]+",\s*type:\s*"[^"]+")'
-    
-    # Replacement with category added
-    replacement = rf'\1,\n        category: "{category}"'
-    
-    content = re.sub(pattern, replacement, content)
+# Match every known node in a single pass; group 2 captures the node name.
+# The pattern is bytes so it can scan the memory-mapped file without decoding.
+node_pattern = re.compile(
+    rb'("(' + b'|'.join(re.escape(name.encode('utf-8')) for name in category_map) + rb')":\s*\{\s*title:\s*"[^"]+",\s*type:\s*"[^"]+")'
+)
+
+# Category suffixes are encoded once up front, keyed by the raw node name bytes
+category_suffixes = {
+    name.encode('utf-8'): f',\n        category: "{category}"'.encode('utf-8')
+    for name, category in category_map.items()
+}
+
+def add_category(match):
+    """Append the category property for the matched node definition."""
+    return match.group(1) + category_suffixes[match.group(2)]
+
+def main(path='utils.js'):
+    """Add the category property to every mapped node in the given file."""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        content = node_pattern.sub(add_category, mm)
+
+    # Write the modified content back (after the mapping is closed)
+    with open(path, 'wb') as f:
+        f.write(content)
 
-# Write the modified content back
-with open('utils.js', 'w', encoding='utf-8') as f:
-    f.write(content)
+    print("Categories added successfully!")
 
-print("Categories added successfully!")
+if __name__ == '__main__':
+    main()
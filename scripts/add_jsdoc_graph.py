@@ -3,42 +3,102 @@ Phase 1.1 - Add JSDoc to GraphController Public Methods
 Safely adds JSDoc documentation without modifying existing code logic.
 """
 
+import bisect
+import functools
+import mmap
 import re
 
-def add_jsdoc_before_method(content, method_signature, jsdoc):
+@functools.lru_cache(maxsize=256)
+def compile_method_patterns(method_signature):
     """
-    Adds JSDoc comment before a method signature.
-    Only adds if JSDoc doesn't already exist.
+    Builds the lookup bytes and insertion pattern for a method signature.
+    Cached so repeated signatures reuse the compiled pattern.
+    Returns (signature, insertion_pattern).
     """
+    # Patterns are bytes so they can scan the memory-mapped file without decoding
+    signature = method_signature.encode('utf-8')
+    # Matches the indented method signature so JSDoc can be inserted before it
+    insertion_pattern = re.compile(rb'(\n)(    ' + re.escape(signature) + rb')')
+    return signature, insertion_pattern
+
+
+def jsdoc_comment_ends(content):
+    """
+    Returns the sorted end offsets of every /** ... */ block in content.
+    Uses plain find() instead of a lazy regex so an unterminated /** stops
+    the scan rather than being retried from every later position.
+    """
+    ends = []
+    start = content.find(b'/**')
+    while start != -1:
+        end = content.find(b'*/', start + 3)
+        if end == -1:
+            break
+        ends.append(end + 2)
+        start = content.find(b'/**', end + 2)
+    return ends
+
+
+def has_jsdoc(content, signature, comment_ends):
+    """
+    Checks whether any occurrence of the signature sits directly below a
+    /** ... */ block, i.e. only whitespace (with a line break) separates them.
+    `comment_ends` is the sorted list of JSDoc end offsets in content.
+    """
+    pos = content.find(signature)
+    while pos != -1:
+        # Nearest comment ending at or before the signature
+        i = bisect.bisect_right(comment_ends, pos)
+        if i:
+            gap = content[comment_ends[i - 1]:pos]
+            if not gap.strip() and b'\n' in gap:
+                return True
+        pos = content.find(signature, pos + 1)
+    return False
+
+
+def find_jsdoc_insertion(content, method_signature, jsdoc, patterns, comment_ends):
+    """
+    Finds where to add a JSDoc comment before a method signature.
+    Only returns an edit if JSDoc doesn't already exist.
+    `patterns` is the precompiled pair from compile_method_patterns().
+    Returns a (start, end, replacement) edit, or None.
+    """
+    signature, pattern = patterns
+
     # Check if method already has JSDoc (/** ... */ directly before it)
-    pattern_with_jsdoc = re.compile(
-        r'/\*\*[\s\S]*?\*/\s*\n\s*' + re.escape(method_signature),
-        re.MULTILINE
-    )
-    
-    if pattern_with_jsdoc.search(content):
+    if has_jsdoc(content, signature, comment_ends):
         print(f"  [SKIP] {method_signature[:40]}... - Already has JSDoc")
-        return content, False
-    
-    # Find the method and add JSDoc before it
-    pattern = re.compile(r'(\n)(    ' + re.escape(method_signature) + ')')
+        return None
     
-    if pattern.search(content):
-        replacement = r'\1' + jsdoc + r'\n\2'
-        content = pattern.sub(replacement, content, count=1)
+    # Find the method and insert JSDoc right before its indented signature
+    match = pattern.search(content)
+    if match:
         print(f"  [ADD]  {method_signature[:40]}...")
-        return content, True
+        return (match.start(2), match.start(2), (jsdoc + '\n').encode('utf-8'))
     else:
         print(f"  [MISS] {method_signature[:40]}... - Not found")
-        return content, False
+        return None
+
+
+def apply_edits(content, edits):
+    """
+    Rebuilds content once from non-overlapping (start, end, replacement) edits,
+    instead of copying the whole string for every individual edit.
+    """
+    parts = []
+    cursor = 0
+    for start, end, replacement in sorted(edits):
+        parts.append(content[cursor:start])
+        parts.append(replacement)
+        cursor = end
+    parts.append(content[cursor:])
+    return b''.join(parts)
 
 
 # Read the file
 filepath = r'c:\Users\Sam Deiter\Documents\GitHub\UE5LMSMaterials\graph.js'
 
-with open(filepath, 'r', encoding='utf-8') as f:
-    content = f.read()
-
 print("=" * 60)
 print("Adding JSDoc to GraphController Public Methods")
 print("=" * 60)
@@ -144,15 +204,28 @@ jsdoc_additions = [
     ),
 ]
 
-added_count = 0
-for method_sig, jsdoc in jsdoc_additions:
-    content, added = add_jsdoc_before_method(content, method_sig, jsdoc)
-    if added:
-        added_count += 1
+# Compile each signature's patterns once before touching the content
+compiled_additions = [
+    (method_sig, jsdoc, compile_method_patterns(method_sig))
+    for method_sig, jsdoc in jsdoc_additions
+]
+
+# Scan the memory-mapped bytes (no full read + UTF-8 decode), collecting
+# every insertion against the original content, then splice once
+with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+    comment_ends = jsdoc_comment_ends(content)
+    edits = []
+    for method_sig, jsdoc, patterns in compiled_additions:
+        edit = find_jsdoc_insertion(content, method_sig, jsdoc, patterns, comment_ends)
+        if edit:
+            edits.append(edit)
+
+    added_count = len(edits)
+    new_content = apply_edits(content, edits)
 
-# Write back
-with open(filepath, 'w', encoding='utf-8') as f:
-    f.write(content)
+# Write back (after the mapping is closed)
+with open(filepath, 'wb') as f:
+    f.write(new_content)
 
 print("=" * 60)
 print(f"Added {added_count} JSDoc comments to GraphController")
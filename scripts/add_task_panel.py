@@ -1,5 +1,3 @@
-import re
-
 # Read index.html
 with open('index.html', 'r', encoding='utf-8') as f:
     html = f.read()
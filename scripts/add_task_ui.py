@@ -1,5 +1,3 @@
-import re
-
 # Step 1: Add task selector to index.html toolbar
 with open('index.html', 'r', encoding='utf-8') as f:
     html = f.read()
@@ -0,0 +1,160 @@
+"""
+Apply All graph.js Fixes
+Runs the edits from fix_graph_connection_dirty.py, fix_graph_dirty_input.py,
+fix_graph_dirty_input_v2.py and fix_nodelibrary.py in a single pass, so
+graph.js is read, scanned and written once instead of once per script.
+"""
+
+import os
+import re
+
+# Literal (message, find, replace) edits gathered from the individual scripts.
+# Finds shared between scripts appear once; when two finds overlap, the longer
+# one wins at its position, so no site is edited twice.
+EDITS = [
+    # fix_graph_dirty_input.py / v2 - Fix Input Click (Stop Propagation)
+    (
+        "Fixed Input Click (added stopPropagation)",
+        b"inputEl.addEventListener('change', updateLiteral);",
+        b"inputEl.addEventListener('change', updateLiteral);\n        inputEl.addEventListener('mousedown', (e) => e.stopPropagation());"
+    ),
+    # fix_graph_dirty_input.py - Mark Dirty on Add Node
+    (
+        "Added markDirty to addNode",
+        b"this.nodesContainer.appendChild(nodeEl);\n    return node;",
+        b"this.nodesContainer.appendChild(nodeEl);\n    this.app.compiler.markDirty();\n    return node;"
+    ),
+    # fix_graph_dirty_input_v2.py - Mark Dirty on Add Node (class indentation)
+    (
+        "Added markDirty to addNode",
+        b"this.nodesContainer.appendChild(nodeEl);\n        return node;",
+        b"this.nodesContainer.appendChild(nodeEl);\n        this.app.compiler.markDirty();\n        return node;"
+    ),
+    # fix_graph_dirty_input.py - Mark Dirty on Delete Node
+    (
+        "Added markDirty to deleteSelectedNodes",
+        b"this.app.details.clear();\n    this.app.persistence.autoSave();\n}",
+        b"this.app.details.clear();\n    this.app.persistence.autoSave();\n    this.app.compiler.markDirty();\n}"
+    ),
+    # fix_graph_dirty_input_v2.py - Mark Dirty on Delete Node (class indentation)
+    (
+        "Added markDirty to deleteSelectedNodes",
+        b"this.app.details.clear();\n        this.app.persistence.autoSave();\n    }",
+        b"this.app.details.clear();\n        this.app.persistence.autoSave();\n        this.app.compiler.markDirty();\n    }"
+    ),
+    # fix_graph_connection_dirty.py / fix_graph_dirty_input.py - conversion node block
+    (
+        "Added markDirty to createConnection",
+        b"this.app.persistence.autoSave();\n                    return;",
+        b"this.app.persistence.autoSave();\n                    this.app.compiler.markDirty();\n                    return;"
+    ),
+    # fix_graph_connection_dirty.py - end of createConnection
+    (
+        "Added markDirty to createConnection",
+        b"    requestAnimationFrame(() => {\n        this.app.graph.redrawNodeWires(endPin.node.id);\n        this.app.graph.redrawNodeWires(startPin.node.id);\n    });\n    this.app.persistence.autoSave();",
+        b"    requestAnimationFrame(() => {\n        this.app.graph.redrawNodeWires(endPin.node.id);\n        this.app.graph.redrawNodeWires(startPin.node.id);\n    });\n    this.app.persistence.autoSave();\n    this.app.compiler.markDirty();"
+    ),
+    # fix_graph_dirty_input.py - end of createConnection
+    (
+        "Added markDirty to createConnection",
+        b"this.app.graph.redrawNodeWires(startPin.node.id);\n    });\n    this.app.persistence.autoSave();",
+        b"this.app.graph.redrawNodeWires(startPin.node.id);\n    });\n    this.app.persistence.autoSave();\n    this.app.compiler.markDirty();"
+    ),
+    # fix_graph_dirty_input.py - Mark Dirty on Break Link
+    (
+        "Added markDirty to breakLinkById",
+        b"this.app.persistence.autoSave();\n    });",
+        b"this.app.persistence.autoSave();\n        this.app.compiler.markDirty();\n    });"
+    ),
+    # fix_nodelibrary.py - import statement and warning message
+    (
+        "Replaced NodeLibrary import",
+        b"import { Utils, NodeLibrary } from './utils.js';",
+        b"import { Utils } from './utils.js';\nimport { nodeRegistry } from './registries/NodeRegistry.js';"
+    ),
+    (
+        "Replaced NodeLibrary warning message",
+        b"not found in NodeLibrary",
+        b"not found in NodeRegistry"
+    ),
+]
+
+# fix_nodelibrary.py - NodeLibrary[key] lookups become nodeRegistry.get(key)
+NODE_LIBRARY_LOOKUP = rb'NodeLibrary\[([^\]]+)\]'
+
+
+def build_pattern(edits):
+    """
+    Builds one alternation over every literal find plus the NodeLibrary lookup.
+    Finds whose replacement only appends text get a negative lookahead for
+    that text, so sites that were already fixed are not edited again.
+    """
+    alternatives = []
+    # Longest first so a longer find text wins over any shorter one sharing its prefix
+    for find in sorted({find for _, find, _ in edits}, key=len, reverse=True):
+        replace = next(r for _, f, r in edits if f == find)
+        alternative = re.escape(find)
+        if replace.startswith(find):
+            alternative += b'(?!' + re.escape(replace[len(find):]) + b')'
+        alternatives.append(alternative)
+    alternatives.append(NODE_LIBRARY_LOOKUP)
+    return re.compile(b'|'.join(alternatives))
+
+
+def main(path='graph.js'):
+    """Apply every fix to the file at path in one read/scan/write."""
+    print("=" * 60)
+    print("Applying all graph.js fixes")
+    print("=" * 60)
+
+    # Read once as bytes (the edits are ASCII, so no UTF-8 decode is needed),
+    # normalizing line endings so every edit only needs the LF form
+    with open(path, 'rb') as f:
+        content = f.read()
+
+    uses_crlf = b'\r\n' in content
+    if uses_crlf:
+        content = content.replace(b'\r\n', b'\n')
+
+    replacements = {find: replace for _, find, replace in EDITS}
+    pattern = build_pattern(EDITS)
+    applied = set()
+    lookups = 0
+
+    def apply_fix(match):
+        nonlocal lookups
+        if match.group(1) is not None:
+            lookups += 1
+            return b'nodeRegistry.get(' + match.group(1) + b')'
+        applied.add(match.group(0))
+        return replacements[match.group(0)]
+
+    content = pattern.sub(apply_fix, content)
+
+    reported = set()
+    for message, find, _ in EDITS:
+        if find in applied and message not in reported:
+            reported.add(message)
+            print(f"  {message}")
+    if lookups:
+        print(f"  Replaced {lookups} NodeLibrary lookups with nodeRegistry.get")
+
+    if not applied and not lookups:
+        print("graph.js already up to date")
+        return
+
+    # Restore the original line endings and write back atomically
+    if uses_crlf:
+        content = content.replace(b'\n', b'\r\n')
+
+    with open(path + '.tmp', 'wb') as f:
+        f.write(content)
+    os.replace(path + '.tmp', path)
+
+    print("=" * 60)
+    print(f"Updated {path}")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,32 +4,38 @@ Removes debug console.log statements from UI controllers.
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 def remove_debug_logs(filepath, patterns_to_remove):
-    """Remove specific console.log lines from a file."""
+    """
+    Remove specific console.log lines from a file.
+    Returns (removed_count, removed_lines) so callers running several files
+    in parallel can print each file's report in order.
+    """
     with open(filepath, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+        content = f.read()
     
-    removed_count = 0
-    new_lines = []
+    # One precompiled multiline pattern matches every whole line that contains
+    # both 'console.log' and one of the debug markers, in a single scan
+    markers = '|'.join(re.escape(pattern) for pattern in patterns_to_remove)
+    debug_line = re.compile(
+        r'^(?=[^\n]*console\.log)(?=[^\n]*(?:' + markers + r'))[^\n]*\n?',
+        re.MULTILINE
+    )
     
-    for i, line in enumerate(lines):
-        # Check if this line contains a debug console.log
-        should_remove = False
-        for pattern in patterns_to_remove:
-            if pattern in line and 'console.log' in line:
-                should_remove = True
-                print(f"  Removing line {i+1}: {line.strip()[:60]}...")
-                removed_count += 1
-                break
-        
-        if not should_remove:
-            new_lines.append(line)
+    removed_lines = []
+    
+    def report(match):
+        line_number = content.count('\n', 0, match.start()) + 1
+        removed_lines.append(f"  Removing line {line_number}: {match.group(0).strip()[:60]}...")
+        return ''
+    
+    new_content, removed_count = debug_line.subn(report, content)
     
     with open(filepath, 'w', encoding='utf-8') as f:
-        f.writelines(new_lines)
+        f.write(new_content)
     
-    return removed_count
+    return removed_count, removed_lines
 
 # Files and patterns to clean
 cleanup_targets = [
@@ -51,10 +57,18 @@ print("=" * 50)
 print("Phase 1.1 Code Cleanup - Removing Debug Logs")
 print("=" * 50)
 
+# Targets are independent files, so read/scan/write them concurrently
+with ThreadPoolExecutor(max_workers=min(8, len(cleanup_targets))) as executor:
+    results = list(executor.map(
+        lambda target: remove_debug_logs(target['file'], target['patterns']),
+        cleanup_targets
+    ))
+
 total_removed = 0
-for target in cleanup_targets:
+for target, (count, removed_lines) in zip(cleanup_targets, results):
     print(f"\nProcessing: {target['file'].split(chr(92))[-1]}")
-    count = remove_debug_logs(target['file'], target['patterns'])
+    for line in removed_lines:
+        print(line)
     total_removed += count
 
 print(f"\n{'=' * 50}")
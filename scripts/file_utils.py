@@ -0,0 +1,27 @@
+"""
+Shared file helpers for the maintenance scripts in this directory.
+Scripts import it as a sibling module (Python puts the running script's
+directory on sys.path).
+"""
+import os
+
+
+def write_if_changed(path, data):
+    """
+    Writes data (str as UTF-8, or bytes) to path through a temp file and
+    os.replace, so an interrupted run never leaves it half-written.
+    Skips the write when the file already holds exactly these bytes, so
+    re-runs do not touch the file or trigger watcher rebuilds.
+    Returns True if the file was written.
+    """
+    new = data.encode('utf-8') if isinstance(data, str) else data
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == new:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path + '.tmp', 'wb') as f:
+        f.write(new)
+    os.replace(path + '.tmp', path)
+    return True
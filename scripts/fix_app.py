@@ -1,5 +1,3 @@
-import re
-
 # Read the file
 with open('app.js', 'r', encoding='utf-8') as f:
     content = f.read()
@@ -1,22 +1,20 @@
-import re
-
-# Read graph.js
-with open('graph.js', 'r', encoding='utf-8') as f:
+# Read graph.js as bytes (the edits are ASCII, so no UTF-8 decode is needed),
+# normalizing line endings once so every edit only needs the LF form
+with open('graph.js', 'rb') as f:
     content = f.read()
 
+uses_crlf = b'\r\n' in content
+if uses_crlf:
+    content = content.replace(b'\r\n', b'\n')
+
 # 1. Add markDirty to conversion block
-if "this.app.persistence.autoSave();\n                    return;" in content:
+if b"this.app.persistence.autoSave();\n                    return;" in content:
     content = content.replace(
-        "this.app.persistence.autoSave();\n                    return;",
-        "this.app.persistence.autoSave();\n                    this.app.compiler.markDirty();\n                    return;"
+        b"this.app.persistence.autoSave();\n                    return;",
+        b"this.app.persistence.autoSave();\n                    this.app.compiler.markDirty();\n                    return;",
+        1
     )
     print("Added markDirty to conversion block")
-elif "this.app.persistence.autoSave();\r\n                    return;" in content:
-    content = content.replace(
-        "this.app.persistence.autoSave();\r\n                    return;",
-        "this.app.persistence.autoSave();\r\n                    this.app.compiler.markDirty();\r\n                    return;"
-    )
-    print("Added markDirty to conversion block (CRLF)")
 else:
     print("WARNING: Could not find conversion block end")
 
@@ -31,13 +29,13 @@ else:
 #         this.app.graph.redrawNodeWires(startPin.node.id);
 #     });
 
-search_block = """    requestAnimationFrame(() => {
+search_block = b"""    requestAnimationFrame(() => {
         this.app.graph.redrawNodeWires(endPin.node.id);
         this.app.graph.redrawNodeWires(startPin.node.id);
     });
     this.app.persistence.autoSave();"""
 
-replace_block = """    requestAnimationFrame(() => {
+replace_block = b"""    requestAnimationFrame(() => {
         this.app.graph.redrawNodeWires(endPin.node.id);
         this.app.graph.redrawNodeWires(startPin.node.id);
     });
@@ -45,20 +43,16 @@ replace_block = """    requestAnimationFrame(() => {
     this.app.compiler.markDirty();"""
 
 if search_block in content:
-    content = content.replace(search_block, replace_block)
+    content = content.replace(search_block, replace_block, 1)
     print("Added markDirty to end of createConnection")
 else:
-    # Try CRLF
-    search_block_crlf = search_block.replace('\n', '\r\n')
-    replace_block_crlf = replace_block.replace('\n', '\r\n')
-    if search_block_crlf in content:
-        content = content.replace(search_block_crlf, replace_block_crlf)
-        print("Added markDirty to end of createConnection (CRLF)")
-    else:
-        print("WARNING: Could not find end of createConnection")
+    print("WARNING: Could not find end of createConnection")
+
+# Restore the original line endings and write back
+if uses_crlf:
+    content = content.replace(b'\n', b'\r\n')
 
-# Write back
-with open('graph.js', 'w', encoding='utf-8') as f:
+with open('graph.js', 'wb') as f:
     f.write(content)
 
 print("Updated graph.js (Connection Dirty Fix)")
@@ -1,19 +1,31 @@
 
+import mmap
 import os
+import re
 
 file_path = r'c:\Users\Sam Deiter\Desktop\UE5LMSBlueprint-main\graph.js'
 
-with open(file_path, 'r', encoding='utf-8') as f:
-    content = f.read()
+# Map the file instead of reading it into a str; only the slices kept
+# around the corrupted section are ever copied
+f = open(file_path, 'rb')
+content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
 # Define the start of the corrupted section
-start_marker = "    updateVariableNodes(oldName, newName) {"
+start_marker = b"    updateVariableNodes(oldName, newName) {"
 # Define the end of the corrupted section (start of the next method)
-end_marker = "selectNode(nodeId, addToSelection = false, mode = 'toggle') {"
-
-# Find indices
-start_idx = content.find(start_marker)
-end_idx = content.find(end_marker)
+end_marker = b"selectNode(nodeId, addToSelection = false, mode = 'toggle') {"
+
+# Find indices of the first occurrence of each marker in a single scan,
+# stopping as soon as both have been seen
+start_idx = end_idx = -1
+for match in re.finditer(re.escape(start_marker) + b'|' + re.escape(end_marker), content):
+    if match.group(0) == start_marker:
+        if start_idx == -1:
+            start_idx = match.start()
+    elif end_idx == -1:
+        end_idx = match.start()
+    if start_idx != -1 and end_idx != -1:
+        break
 
 if start_idx == -1 or end_idx == -1:
     print("Could not find markers.")
@@ -49,6 +61,9 @@ correct_code = """    updateVariableNodes(oldName, newName) {
 
         // Preserve old pins to keep connections valid
         const oldPinsMap = new Map(node.pins.map(p => [p.id, p]));
+        const wiringLinks = this.app.wiring.links;
+        // Literals for the new pin set are collected here and swapped in once
+        const newLiterals = new Map();
 
         node.pins = template.pins.map(p => {
             const newPin = new Pin(node, p);
@@ -57,9 +72,9 @@ correct_code = """    updateVariableNodes(oldName, newName) {
             if (oldPin) {
                 newPin.links = oldPin.links;
                 newPin.defaultValue = oldPin.defaultValue;
-                node.pinLiterals.set(newPin.id, node.pinLiterals.get(oldPin.id));
+                newLiterals.set(newPin.id, node.pinLiterals.get(oldPin.id));
                 newPin.links.forEach(linkId => {
-                    const link = this.app.wiring.links.get(linkId);
+                    const link = wiringLinks.get(linkId);
                     if (link) {
                         if (link.startPin === oldPin) link.startPin = newPin;
                         if (link.endPin === oldPin) link.endPin = newPin;
@@ -68,6 +83,7 @@ correct_code = """    updateVariableNodes(oldName, newName) {
             }
             return newPin;
         });
+        node.pinLiterals = newLiterals;
 
         node.refreshPinCache();
         this.app.wiring.updateVisuals(node);
@@ -90,15 +106,24 @@ correct_code = """    updateVariableNodes(oldName, newName) {
 # Let's adjust end_idx to include the indentation before it if possible, or just append the correct indentation.
 
 # Actually, let's look at the file content around end_idx to see indentation.
-subset = content[end_idx-20:end_idx+20]
+subset = content[end_idx-20:end_idx+20].decode('utf-8', errors='replace')
 print(f"Context around end match: {repr(subset)}")
 
 # The replacement should end with indentation for selectNode.
 # selectNode is a method of GraphController, so it should be indented by 4 spaces.
 
-new_content = content[:start_idx] + correct_code + "    " + content[end_idx:].lstrip()
+# Match the file's own line endings, since it is written back as bytes
+newline = '\r\n' if content.find(b'\r\n') != -1 else '\n'
+replacement = correct_code.replace('\n', newline).encode('utf-8')
+
+# Join the pieces in one allocation instead of chained concatenation. The tail
+# needs no lstrip(): end_idx points at the 's' of selectNode itself.
+new_content = b"".join((content[:start_idx], replacement, b"    ", content[end_idx:]))
+
+content.close()
+f.close()
 
-with open(file_path, 'w', encoding='utf-8') as f:
+with open(file_path, 'wb') as f:
     f.write(new_content)
 
 print("Successfully fixed graph.js corruption.")
@@ -1,66 +1,105 @@
+import functools
 import re
 
-# Read graph.js
-with open('graph.js', 'r', encoding='utf-8') as f:
-    content = f.read()
 
-# 1. Fix Input Click (Stop Propagation)
-# Find createInputWidget and the inputEl creation
-if "inputEl.addEventListener('change', updateLiteral);" in content:
-    content = content.replace(
-        "inputEl.addEventListener('change', updateLiteral);",
-        "inputEl.addEventListener('change', updateLiteral);\n        inputEl.addEventListener('mousedown', (e) => e.stopPropagation());"
-    )
-    print("Fixed Input Click (added stopPropagation)")
+@functools.lru_cache(maxsize=None)
+def compile_edit_pattern(finds):
+    """
+    Builds one alternation matching any of the literal find strings.
+    Cached per edit table so repeated runs in one process skip compilation.
+    """
+    # Longest first so a longer find text wins over any shorter one sharing its prefix
+    return re.compile(b'|'.join(
+        re.escape(find) for find in sorted(finds, key=len, reverse=True)
+    ))
+
+
+def apply_edits(content, edits):
+    """
+    Applies every literal (find, replace) edit in a single scan of content.
+    Returns (new_content, applied) where applied is the set of finds that matched.
+    """
+    replacements = dict(edits)
+    pattern = compile_edit_pattern(tuple(replacements))
+    applied = set()
 
-# 2. Mark Dirty on Add Node
-# Look for the end of addNode function
-if "this.nodesContainer.appendChild(nodeEl);\n    return node;" in content:
-    content = content.replace(
-        "this.nodesContainer.appendChild(nodeEl);\n    return node;",
-        "this.nodesContainer.appendChild(nodeEl);\n    this.app.compiler.markDirty();\n    return node;"
-    )
-    print("Added markDirty to addNode")
+    def replace(match):
+        applied.add(match.group(0))
+        return replacements[match.group(0)]
 
-# 3. Mark Dirty on Delete Node
-# Look for autoSave in deleteSelectedNodes
-if "this.app.persistence.autoSave();\n}" in content:
-    # Be careful not to replace other autoSave calls if they look identical at end of function
-    # We can target the specific context of deleteSelectedNodes
-    # Let's use a more specific replacement for deleteSelectedNodes
-    content = content.replace(
-        "this.app.details.clear();\n    this.app.persistence.autoSave();\n}",
-        "this.app.details.clear();\n    this.app.persistence.autoSave();\n    this.app.compiler.markDirty();\n}"
-    )
-    print("Added markDirty to deleteSelectedNodes")
+    return pattern.sub(replace, content), applied
+
+
+# Read graph.js as bytes (the edits are ASCII, so no UTF-8 decode is needed),
+# normalizing line endings once so every edit only needs the LF form
+with open('graph.js', 'rb') as f:
+    content = f.read()
 
-# 4. Mark Dirty on Connect
-# In WiringController.createConnection
+uses_crlf = b'\r\n' in content
+if uses_crlf:
+    content = content.replace(b'\r\n', b'\n')
 
-# Conversion node block
-content = content.replace(
-    "this.app.persistence.autoSave();\n                    return;",
-    "this.app.persistence.autoSave();\n                    this.app.compiler.markDirty();\n                    return;"
-)
+# Each fix is a literal (find, replace) pair. They are all applied in one
+# scan of the file by apply_edits(), instead of one full-file str.replace
+# pass (and copy) per fix.
+fixes = [
+    # 1. Fix Input Click (Stop Propagation)
+    # Find createInputWidget and the inputEl creation
+    (
+        "Fixed Input Click (added stopPropagation)",
+        b"inputEl.addEventListener('change', updateLiteral);",
+        b"inputEl.addEventListener('change', updateLiteral);\n        inputEl.addEventListener('mousedown', (e) => e.stopPropagation());"
+    ),
+    # 2. Mark Dirty on Add Node
+    # Look for the end of addNode function
+    (
+        "Added markDirty to addNode",
+        b"this.nodesContainer.appendChild(nodeEl);\n    return node;",
+        b"this.nodesContainer.appendChild(nodeEl);\n    this.app.compiler.markDirty();\n    return node;"
+    ),
+    # 3. Mark Dirty on Delete Node
+    # Target the specific context of deleteSelectedNodes so other
+    # identical-looking autoSave calls at the end of functions are left alone
+    (
+        "Added markDirty to deleteSelectedNodes",
+        b"this.app.details.clear();\n    this.app.persistence.autoSave();\n}",
+        b"this.app.details.clear();\n    this.app.persistence.autoSave();\n    this.app.compiler.markDirty();\n}"
+    ),
+    # 4. Mark Dirty on Connect
+    # In WiringController.createConnection - conversion node block
+    (
+        "Added markDirty to createConnection",
+        b"this.app.persistence.autoSave();\n                    return;",
+        b"this.app.persistence.autoSave();\n                    this.app.compiler.markDirty();\n                    return;"
+    ),
+    # End of createConnection
+    (
+        "Added markDirty to createConnection",
+        b"this.app.graph.redrawNodeWires(startPin.node.id);\n    });\n    this.app.persistence.autoSave();",
+        b"this.app.graph.redrawNodeWires(startPin.node.id);\n    });\n    this.app.persistence.autoSave();\n    this.app.compiler.markDirty();"
+    ),
+    # 5. Mark Dirty on Break Link
+    # breakLinkById has autoSave inside requestAnimationFrame
+    (
+        "Added markDirty to breakLinkById",
+        b"this.app.persistence.autoSave();\n    });",
+        b"this.app.persistence.autoSave();\n        this.app.compiler.markDirty();\n    });"
+    ),
+]
 
-# End of createConnection
-content = content.replace(
-    "this.app.graph.redrawNodeWires(startPin.node.id);\n    });\n    this.app.persistence.autoSave();",
-    "this.app.graph.redrawNodeWires(startPin.node.id);\n    });\n    this.app.persistence.autoSave();\n    this.app.compiler.markDirty();"
-)
-print("Added markDirty to createConnection")
+content, applied = apply_edits(content, [(find, replace) for _, find, replace in fixes])
 
+reported = set()
+for message, find, _ in fixes:
+    if find in applied and message not in reported:
+        reported.add(message)
+        print(message)
 
-# 5. Mark Dirty on Break Link
-# breakLinkById has autoSave inside requestAnimationFrame
-content = content.replace(
-    "this.app.persistence.autoSave();\n    });",
-    "this.app.persistence.autoSave();\n        this.app.compiler.markDirty();\n    });"
-)
-print("Added markDirty to breakLinkById")
+# Restore the original line endings and write back
+if uses_crlf:
+    content = content.replace(b'\n', b'\r\n')
 
-# Write back
-with open('graph.js', 'w', encoding='utf-8') as f:
+with open('graph.js', 'wb') as f:
     f.write(content)
 
 print("Updated graph.js with dirty state tracking and input fix")
@@ -1,75 +1,86 @@
+import os
 import re
 
-# Read graph.js
-with open('graph.js', 'r', encoding='utf-8') as f:
+# Read graph.js as bytes (the edits are ASCII, so no UTF-8 decode is needed),
+# normalizing line endings once so every edit only needs the LF form
+with open('graph.js', 'rb') as f:
     content = f.read()
 
+uses_crlf = b'\r\n' in content
+if uses_crlf:
+    content = content.replace(b'\r\n', b'\n')
+
+# Literal (find, replace) fixes, applied together in one scan of the file
+fixes = {}
+
 # 1. Fix Input Click (Stop Propagation) - Already applied?
 # Let's check if it's already there
-if "inputEl.addEventListener('mousedown', (e) => e.stopPropagation());" not in content:
-    if "inputEl.addEventListener('change', updateLiteral);" in content:
-        content = content.replace(
-            "inputEl.addEventListener('change', updateLiteral);",
-            "inputEl.addEventListener('change', updateLiteral);\n        inputEl.addEventListener('mousedown', (e) => e.stopPropagation());"
-        )
-        print("Fixed Input Click (added stopPropagation)")
+if b"inputEl.addEventListener('mousedown', (e) => e.stopPropagation());" not in content:
+    fixes[b"inputEl.addEventListener('change', updateLiteral);"] = (
+        b"inputEl.addEventListener('change', updateLiteral);\n        inputEl.addEventListener('mousedown', (e) => e.stopPropagation());"
+    )
 else:
     print("Input Click fix already present")
 
 # 2. Mark Dirty on Add Node
 # Target: this.nodesContainer.appendChild(nodeEl);
 #         return node;
-if "this.nodesContainer.appendChild(nodeEl);\n        return node;" in content:
-    content = content.replace(
-        "this.nodesContainer.appendChild(nodeEl);\n        return node;",
-        "this.nodesContainer.appendChild(nodeEl);\n        this.app.compiler.markDirty();\n        return node;"
-    )
-    print("Added markDirty to addNode")
-else:
-    # Try looser match
-    content = content.replace(
-        "this.nodesContainer.appendChild(nodeEl);\r\n        return node;",
-        "this.nodesContainer.appendChild(nodeEl);\r\n        this.app.compiler.markDirty();\r\n        return node;"
-    )
-    if "this.app.compiler.markDirty();\n        return node;" in content or "this.app.compiler.markDirty();\r\n        return node;" in content:
-         print("Added markDirty to addNode (CRLF)")
-    else:
-         print("WARNING: Could not match addNode end block")
+fixes[b"this.nodesContainer.appendChild(nodeEl);\n        return node;"] = (
+    b"this.nodesContainer.appendChild(nodeEl);\n        this.app.compiler.markDirty();\n        return node;"
+)
 
 # 3. Mark Dirty on Delete Node
 # Target: this.app.persistence.autoSave();
 #     }
 # inside deleteSelectedNodes
 # We can search for the end of the function
-if "this.app.details.clear();\n        this.app.persistence.autoSave();\n    }" in content:
-    content = content.replace(
-        "this.app.details.clear();\n        this.app.persistence.autoSave();\n    }",
-        "this.app.details.clear();\n        this.app.persistence.autoSave();\n        this.app.compiler.markDirty();\n    }"
-    )
+fixes[b"this.app.details.clear();\n        this.app.persistence.autoSave();\n    }"] = (
+    b"this.app.details.clear();\n        this.app.persistence.autoSave();\n        this.app.compiler.markDirty();\n    }"
+)
+
+# Longest first so a longer find text wins over any shorter one sharing its prefix
+fix_pattern = re.compile(b'|'.join(
+    re.escape(find) for find in sorted(fixes, key=len, reverse=True)
+))
+
+applied = set()
+
+def apply_fix(match):
+    applied.add(match.group(0))
+    return fixes[match.group(0)]
+
+content = fix_pattern.sub(apply_fix, content)
+
+if b"inputEl.addEventListener('change', updateLiteral);" in applied:
+    print("Fixed Input Click (added stopPropagation)")
+
+if b"this.nodesContainer.appendChild(nodeEl);\n        return node;" in applied:
+    print("Added markDirty to addNode")
+else:
+    print("WARNING: Could not match addNode end block")
+
+if b"this.app.details.clear();\n        this.app.persistence.autoSave();\n    }" in applied:
     print("Added markDirty to deleteSelectedNodes")
 else:
-    # Try looser match
-    content = content.replace(
-        "this.app.details.clear();\r\n        this.app.persistence.autoSave();\r\n    }",
-        "this.app.details.clear();\r\n        this.app.persistence.autoSave();\r\n        this.app.compiler.markDirty();\r\n    }"
-    )
-    if "this.app.compiler.markDirty();\n    }" in content or "this.app.compiler.markDirty();\r\n    }" in content:
-        print("Added markDirty to deleteSelectedNodes (CRLF)")
-    else:
-        print("WARNING: Could not match deleteSelectedNodes end block")
+    print("WARNING: Could not match deleteSelectedNodes end block")
 
 # 4. Mark Dirty on Connect - Already applied?
-if "this.app.compiler.markDirty();\n                    return;" in content:
+if b"this.app.compiler.markDirty();\n                    return;" in content:
     print("markDirty on Connect (conversion) already present")
 else:
     print("WARNING: markDirty on Connect (conversion) NOT found")
 
-if "this.app.compiler.markDirty();" in content and "redrawNodeWires(startPin.node.id)" in content:
-     # Hard to verify exact location with simple check, but previous script said it succeeded
-     pass
+# Leave the file untouched when every fix was already present
+if not applied:
+    print("graph.js already up to date")
+else:
+    # Restore the original line endings and write back through a temp file,
+    # so an interrupted run can never leave graph.js half-written
+    if uses_crlf:
+        content = content.replace(b'\n', b'\r\n')
 
-# Write back
-with open('graph.js', 'w', encoding='utf-8') as f:
-    f.write(content)
+    with open('graph.js.tmp', 'wb') as f:
+        f.write(content)
+    os.replace('graph.js.tmp', 'graph.js')
 
-print("Updated graph.js")
+    print("Updated graph.js")
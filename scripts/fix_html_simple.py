@@ -15,19 +15,27 @@ replace_text = '''                <button id="help-btn" title="Help (F1)"><i cla
             </div>
         </div>'''
 
-if find_text in html:
-    html = html.replace(find_text, replace_text)
-    with open('index.html', 'w', encoding='utf-8') as f:
-        f.write(html)
-    print("Successfully added task-selector to index.html")
+# Skip entirely if the selector was already added
+if 'id="task-selector"' in html:
+    print("task-selector already present in index.html")
 else:
-    print("Could not find exact match. Trying alternative approach...")
-    # Try with Unix line endings
-    find_text2 = '                <button id="help-btn" title="Help (F1)"><i class="fas fa-question-circle"></i> Help</button>\n            </div>\n        </div>'
-    if find_text2 in html:
-        html = html.replace(find_text2, replace_text)
+    # One find() per variant: it both tests for the target and locates it,
+    # so the replacement is spliced in without a second scan
+    index = html.find(find_text)
+    if index != -1:
+        html = html[:index] + replace_text + html[index + len(find_text):]
         with open('index.html', 'w', encoding='utf-8') as f:
             f.write(html)
-        print("Successfully added task-selector to index.html (Unix)")
+        print("Successfully added task-selector to index.html")
     else:
-        print("ERROR: Could not find target location in HTML")
+        print("Could not find exact match. Trying alternative approach...")
+        # Try with Unix line endings
+        find_text2 = '                <button id="help-btn" title="Help (F1)"><i class="fas fa-question-circle"></i> Help</button>\n            </div>\n        </div>'
+        index = html.find(find_text2)
+        if index != -1:
+            html = html[:index] + replace_text + html[index + len(find_text2):]
+            with open('index.html', 'w', encoding='utf-8') as f:
+                f.write(html)
+            print("Successfully added task-selector to index.html (Unix)")
+        else:
+            print("ERROR: Could not find target location in HTML")
@@ -1,23 +1,35 @@
+import mmap
 import re
 
-# Read the file
-with open('graph.js', 'r', encoding='utf-8') as f:
-    content = f.read()
-
-# Replace import statement
-content = content.replace(
-    "import { Utils, NodeLibrary } from './utils.js';",
-    "import { Utils } from './utils.js';\nimport { nodeRegistry } from './registries/NodeRegistry.js';"
+# All three edits are matched by one precompiled bytes pattern, so the file
+# is scanned once instead of once per replacement:
+#   - the old `import { Utils, NodeLibrary }` statement
+#   - NodeLibrary[nodeData.nodeKey] lookups (group 1 captures the key)
+#   - the 'not found in NodeLibrary' warning message
+NODE_LIBRARY_PATTERN = re.compile(
+    rb"import \{ Utils, NodeLibrary \} from './utils\.js';"
+    rb"|NodeLibrary\[([^\]]+)\]"
+    rb"|not found in NodeLibrary(?!\[)"
 )
 
-# Replace NodeLibrary[nodeData.nodeKey] with nodeRegistry.get(nodeData.nodeKey)
-content = re.sub(r'NodeLibrary\[([^\]]+)\]', r'nodeRegistry.get(\1)', content)
+# Map the file and work on bytes, so it is never decoded into a str
+with open('graph.js', 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+    newline = b'\r\n' if mm.find(b'\r\n') != -1 else b'\n'
+
+    def replace_node_library(match):
+        # Replace NodeLibrary[nodeData.nodeKey] with nodeRegistry.get(nodeData.nodeKey)
+        if match.group(1) is not None:
+            return b'nodeRegistry.get(' + match.group(1) + b')'
+        # Replace the warning message
+        if match.group(0).startswith(b'not found'):
+            return b'not found in NodeRegistry'
+        # Replace import statement
+        return b"import { Utils } from './utils.js';" + newline + b"import { nodeRegistry } from './registries/NodeRegistry.js';"
 
-# Replace the warning message
-content = content.replace('not found in NodeLibrary', 'not found in NodeRegistry')
+    content = NODE_LIBRARY_PATTERN.sub(replace_node_library, mm)
 
-# Write back
-with open('graph.js', 'w', encoding='utf-8') as f:
+# Write back (after the mapping is closed)
+with open('graph.js', 'wb') as f:
     f.write(content)
 
 print("Fixed graph.js!")
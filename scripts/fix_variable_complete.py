@@ -4,21 +4,16 @@ import re
 with open('ui/VariableController.js', 'r', encoding='utf-8') as f:
     content = f.read()
 
-# Fix the import statement
-content = content.replace(
-    "import { Utils, NodeLibrary } from '../utils.js';",
-    "import { Utils } from '../utils.js';\nimport { nodeRegistry } from '../registries/NodeRegistry.js';"
-)
-
-# Replace delete NodeLibrary[key] with nodeRegistry.unregister(key)
-content = content.replace(
-    "delete NodeLibrary[getKey];",
-    "nodeRegistry.unregister(getKey);"
-)
-content = content.replace(
-    "delete NodeLibrary[setKey];",
-    "nodeRegistry.unregister(setKey);"
-)
+edits = [
+    # Fix the import statement
+    (
+        "import { Utils, NodeLibrary } from '../utils.js';",
+        "import { Utils } from '../utils.js';\nimport { nodeRegistry } from '../registries/NodeRegistry.js';"
+    ),
+    # Replace delete NodeLibrary[key] with nodeRegistry.unregister(key)
+    ("delete NodeLibrary[getKey];", "nodeRegistry.unregister(getKey);"),
+    ("delete NodeLibrary[setKey];", "nodeRegistry.unregister(setKey);"),
+]
 
 # Replace the entire updateNodeLibrary method
 old_method = '''    updateNodeLibrary() {
@@ -94,7 +89,14 @@ new_method = '''    updateNodeLibrary() {
         this.app.palette.populateList();
     }'''
 
-content = content.replace(old_method, new_method)
+edits.append((old_method, new_method))
+
+# Apply every edit in one scan: a literal alternation matched once over the
+# file, dispatching each hit to its replacement, instead of one full-file
+# str.replace pass per edit
+table = dict(edits)
+edit_pattern = re.compile('|'.join(re.escape(find) for find, _ in edits))
+content = edit_pattern.sub(lambda match: table[match.group(0)], content)
 
 # Write back
 with open('ui/VariableController.js', 'w', encoding='utf-8') as f:
@@ -12,28 +12,39 @@ Default output: ../data/MaterialExpressionDefinitions_generated.js
 """
 
 import os
+import pickle
 import re
 import json
+import mmap
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from typing import List, Optional
 
 # =============================================================================
 # DATA STRUCTURES
 # =============================================================================
 
-@dataclass
 class PinDefinition:
     """Represents an input or output pin on a material node."""
-    id: str
-    name: str
-    pin_type: str = "float"
-    required: bool = True
-    default_value: Optional[float] = None
-    tooltip: str = ""
+    # Plain slotted class rather than a dataclass: pins are created for every
+    # input of every expression, so construction is kept to direct assignments
+    __slots__ = ('id', 'name', 'pin_type', 'required', 'default_value', 'tooltip')
+    
+    def __init__(self, id: str, name: str, pin_type: str = "float", required: bool = True,
+                 default_value: Optional[float] = None, tooltip: str = ""):
+        self.id = id
+        self.name = name
+        self.pin_type = pin_type
+        self.required = required
+        self.default_value = default_value
+        self.tooltip = tooltip
 
-@dataclass
+@dataclass(slots=True)
 class ExpressionDefinition:
     """Represents a complete material expression node definition."""
     key: str
@@ -47,28 +58,32 @@ class ExpressionDefinition:
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return {
+        inputs = []
+        for p in self.inputs:
+            default_value = p.default_value
+            tooltip = p.tooltip
+            pin = {"id": p.id, "name": p.name, "type": p.pin_type, "required": p.required}
+            if default_value is not None:
+                pin["defaultValue"] = default_value
+            if tooltip:
+                pin["tooltip"] = tooltip
+            inputs.append(pin)
+        
+        result = {
             "key": self.key,
             "title": self.title,
             "category": self.category,
-            "inputs": [
-                {
-                    "id": p.id,
-                    "name": p.name,
-                    "type": p.pin_type,
-                    "required": p.required,
-                    **({"defaultValue": p.default_value} if p.default_value is not None else {}),
-                    **({"tooltip": p.tooltip} if p.tooltip else {})
-                }
-                for p in self.inputs
-            ],
+            "inputs": inputs,
             "outputs": [
                 {"id": p.id, "name": p.name, "type": p.pin_type}
                 for p in self.outputs
             ],
-            **({"keywords": self.keywords} if self.keywords else {}),
-            **({"hotkey": self.hotkey} if self.hotkey else {})
         }
+        if self.keywords:
+            result["keywords"] = self.keywords
+        if self.hotkey:
+            result["hotkey"] = self.hotkey
+        return result
 
 # =============================================================================
 # CATEGORY MAPPING
@@ -164,79 +179,235 @@ HOTKEY_MAP = {
     "Fresnel": "F",
 }
 
+# Bound lookups, resolved once instead of per expression
+_CAT_GET = CATEGORY_MAP.get
+_HOT_GET = HOTKEY_MAP.get
+
 # =============================================================================
 # PARSER LOGIC
 # =============================================================================
 
-class MaterialExpressionParser:
-    """Parses UE5 MaterialExpression header files."""
-    
-    # Regex patterns
-    RE_CLASS = re.compile(
-        r'class\s+(?:ENGINE_API\s+)?U(MaterialExpression\w+)\s*:\s*public\s+(\w+)',
-        re.MULTILINE
-    )
-    
-    RE_INPUT = re.compile(
-        r'UPROPERTY\s*\(\s*meta\s*=\s*\(\s*'
-        r'(?:RequiredInput\s*=\s*"(\w+)"\s*,?\s*)?'
-        r'(?:ToolTip\s*=\s*"([^"]+)"\s*,?\s*)?'
-        r'[^)]*\)\s*\)\s*\n\s*FExpressionInput\s+(\w+)\s*;',
-        re.MULTILINE | re.DOTALL
-    )
+# Substring rules for type guessing, checked in order. Each rule's needles are
+# one precompiled alternation, so a rule is a single C-level search rather
+# than a Python any() over a fresh list
+_PIN_TYPE_RULES = (
+    (re.compile('coord|uv|position2d'), "float2"),
+    (re.compile('color|rgb|normal|position|vector|direction'), "float3"),
+    (re.compile('rgba|color4'), "float4"),
+    (re.compile('texture|tex'), "texture"),
+    (re.compile('bool|switch|condition'), "bool"),
+)
+
+_OUTPUT_TYPE_RULES = (
+    (re.compile('texture'), "float4"),
+    (re.compile('normal'), "float3"),
+    (re.compile('vector|position|color|rgb'), "float3"),
+    (re.compile('mask'), "float"),
+)
+
+@lru_cache(maxsize=None)
+def _guess_pin_type(name: str) -> str:
+    """Guess pin type from name (cached: pin names repeat across headers)."""
+    name_lower = name.lower()
     
-    RE_INPUT_SIMPLE = re.compile(
-        r'FExpressionInput\s+(\w+)\s*;',
-        re.MULTILINE
-    )
+    for needles, pin_type in _PIN_TYPE_RULES:
+        if needles.search(name_lower):
+            return pin_type
     
-    RE_CONST_DEFAULT = re.compile(
-        r'UPROPERTY\s*\([^)]*OverridingInputProperty\s*=\s*"(\w+)"[^)]*\)\s*\n\s*'
-        r'(?:float|int32|uint8)\s+(\w+)\s*=\s*([\d.f-]+)\s*;',
-        re.MULTILINE | re.DOTALL
-    )
+    return "float"
+
+@lru_cache(maxsize=None)
+def _guess_output_type(key: str) -> str:
+    """Guess output type based on node key."""
+    key_lower = key.lower()
     
-    RE_KEYWORDS = re.compile(
-        r'virtual\s+FText\s+GetKeywords\s*\([^)]*\)\s*const[^{]*\{\s*return\s+FText::FromString\s*\(\s*TEXT\s*\(\s*"([^"]+)"',
-        re.MULTILINE | re.DOTALL
-    )
+    for needles, output_type in _OUTPUT_TYPE_RULES:
+        if needles.search(key_lower):
+            return output_type
     
-    RE_CREATION_NAME = re.compile(
-        r'virtual\s+FText\s+GetCreationName\s*\([^)]*\)\s*const[^{]*\{\s*return\s+FText::FromString\s*\(\s*TEXT\s*\(\s*"([^"]+)"',
-        re.MULTILINE | re.DOTALL
-    )
+    # Default to float for math operations
+    return "float"
+
+# Regex patterns (bytes: headers are scanned straight from an mmap). Compiled
+# once at import, which each pool worker does once for all the files it parses
+_RE_CLASS = re.compile(
+    rb'class\s+(?:ENGINE_API\s+)?U(MaterialExpression\w+)\s*:\s*public\s+(\w+)',
+    re.MULTILINE
+)
+
+_RE_INPUT = re.compile(
+    rb'UPROPERTY\s*\(\s*meta\s*=\s*\(\s*'
+    rb'(?:RequiredInput\s*=\s*"(\w+)"\s*,?\s*)?'
+    rb'(?:ToolTip\s*=\s*"([^"]+)"\s*,?\s*)?'
+    rb'[^)]*\)\s*\)\s*\n\s*FExpressionInput\s+(\w+)\s*;',
+    re.MULTILINE | re.DOTALL
+)
+
+_RE_INPUT_SIMPLE = re.compile(
+    rb'FExpressionInput\s+(\w+)\s*;',
+    re.MULTILINE
+)
+
+_RE_CONST_DEFAULT = re.compile(
+    rb'UPROPERTY\s*\([^)]*OverridingInputProperty\s*=\s*"(\w+)"[^)]*\)\s*\n\s*'
+    rb'(?:float|int32|uint8)\s+(\w+)\s*=\s*([\d.f-]+)\s*;',
+    re.MULTILINE | re.DOTALL
+)
+
+# GetKeywords/GetCreationName only match an inline body: `const[^{]*` would
+# let a bodiless `... const override;` declaration run on to the next `{`,
+# and since _RE_ALL matches cannot overlap, that span would hide the inputs
+# declared in between
+_RE_KEYWORDS = re.compile(
+    rb'virtual\s+FText\s+GetKeywords\s*\([^)]*\)\s*const\s*(?:override\s*)?(?:final\s*)?\{\s*return\s+FText::FromString\s*\(\s*TEXT\s*\(\s*"([^"]+)"',
+    re.MULTILINE | re.DOTALL
+)
+
+_RE_CREATION_NAME = re.compile(
+    rb'virtual\s+FText\s+GetCreationName\s*\([^)]*\)\s*const\s*(?:override\s*)?(?:final\s*)?\{\s*return\s+FText::FromString\s*\(\s*TEXT\s*\(\s*"([^"]+)"',
+    re.MULTILINE | re.DOTALL
+)
+
+# All per-file patterns as one alternation, so each header is scanned once.
+# m.lastgroup names the alternative that matched; that pattern's own
+# groups follow its named group (see _groups)
+_RE_ALL = re.compile(
+    b'|'.join(b'(?P<' + name + b'>' + pattern.pattern + b')' for name, pattern in (
+        (b'cls', _RE_CLASS),
+        (b'input', _RE_INPUT),
+        (b'simple', _RE_INPUT_SIMPLE),
+        (b'const', _RE_CONST_DEFAULT),
+        (b'keywords', _RE_KEYWORDS),
+        (b'cname', _RE_CREATION_NAME),
+    )),
+    re.MULTILINE | re.DOTALL
+)
+
+# Bump whenever parse_file's output changes, so cached parses from an older
+# version of this script are discarded instead of reused
+PARSE_CACHE_VERSION = 1
+
+class MaterialExpressionParser:
+    """Parses UE5 MaterialExpression header files."""
     
-    def __init__(self, source_dir: Path):
+    def __init__(self, source_dir: Path, cache_path: Optional[Path] = None):
         self.source_dir = source_dir
+        self.cache_path = cache_path
         self.definitions: List[ExpressionDefinition] = []
         
     def parse_all(self) -> List[ExpressionDefinition]:
         """Parse all MaterialExpression*.h files in the source directory."""
-        pattern = self.source_dir / "MaterialExpression*.h"
-        files = list(self.source_dir.glob("MaterialExpression*.h"))
+        # A single scandir pass; DirEntry caches the file type from the listing,
+        # and plain path strings are passed on instead of building Path objects.
+        # Each file's (mtime, size) stamp decides whether its cached parse is reused
+        with os.scandir(self.source_dir) as entries:
+            files = sorted(
+                (entry.path, (entry.stat().st_mtime_ns, entry.stat().st_size))
+                for entry in entries
+                if entry.name.startswith("MaterialExpression")
+                and entry.name.endswith(".h")
+                and entry.is_file()
+            )
         
         print(f"Found {len(files)} MaterialExpression header files")
         
-        for file_path in sorted(files):
-            try:
-                self.parse_file(file_path)
-            except Exception as e:
-                print(f"  Error parsing {file_path.name}: {e}")
+        cache = self._load_cache()
+        stale = [path for path, stamp in files if cache.get(path, (None,))[0] != stamp]
+        if cache:
+            print(f"Reusing {len(files) - len(stale)} cached headers, re-parsing {len(stale)}")
+        
+        # Headers are independent, so parse the changed ones across worker
+        # processes; results come back in submission order, keeping the output stable
+        updated = {}
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(_parse_header, stale, chunksize=8)
+            for file_path, stamp in files:
+                cached = cache.get(file_path)
+                if cached is not None and cached[0] == stamp:
+                    definition = cached[1]
+                else:
+                    file_path, definition, error = next(results)
+                    if error is not None:
+                        print(f"  Error parsing {os.path.basename(file_path)}: {error}")
+                        continue
+                # Headers without an expression are cached too, so they are
+                # not re-read on the next run either
+                updated[file_path] = (stamp, definition)
+                if definition is not None:
+                    self.definitions.append(definition)
+                    print(f"  Parsed: {definition.key} ({len(definition.inputs)} inputs)")
+        
+        if stale or len(updated) != len(cache):
+            self._save_cache(updated)
         
         print(f"Successfully parsed {len(self.definitions)} expression definitions")
         return self.definitions
     
-    def parse_file(self, file_path: Path) -> Optional[ExpressionDefinition]:
+    def _load_cache(self) -> dict:
+        """Load {path: ((mtime_ns, size), definition)} from the previous run."""
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, 'rb') as f:
+                version, cache = pickle.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Ignoring unreadable parse cache {self.cache_path}: {e}")
+            return {}
+        # A cache written by a different parser version may hold stale results
+        return cache if version == PARSE_CACHE_VERSION else {}
+    
+    def _save_cache(self, cache: dict):
+        """Write the parse cache through a temp file, so it is never half-written."""
+        if self.cache_path is None:
+            return
+        tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((PARSE_CACHE_VERSION, cache), f, protocol=5)
+        os.replace(tmp_path, self.cache_path)
+    
+    def parse_file(self, file_path: str) -> Optional[ExpressionDefinition]:
         """Parse a single header file."""
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        class_groups = keywords = creation_name = None
+        meta_inputs = []
+        simple_inputs = []
+        const_defaults = []
+        
+        # Map the header and scan the raw bytes, skipping a full UTF-8 decode;
+        # only the captured groups are decoded
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                # _RE_CLASS can only match where this literal occurs; a plain
+                # find() rules out unrelated headers without running the regex
+                if content.find(b'UMaterialExpression') == -1:
+                    return None
+                
+                # Collect every match kind in a single pass over the header
+                for match in _RE_ALL.finditer(content):
+                    kind = match.lastgroup
+                    if kind == 'cls':
+                        if class_groups is None:
+                            class_groups = self._groups(match, 2)
+                    elif kind == 'input':
+                        meta_inputs.append(self._groups(match, 3))
+                    elif kind == 'simple':
+                        simple_inputs.append(self._groups(match, 1)[0])
+                    elif kind == 'const':
+                        const_defaults.append(self._groups(match, 3))
+                    elif kind == 'keywords':
+                        if keywords is None:
+                            keywords = self._groups(match, 1)[0]
+                    elif creation_name is None:
+                        creation_name = self._groups(match, 1)[0]
         
         # Find the class declaration
-        class_match = self.RE_CLASS.search(content)
-        if not class_match:
+        if not class_groups:
             return None
         
-        full_class_name = class_match.group(1)
-        base_class = class_match.group(2)
+        full_class_name, base_class = class_groups
         
         # Extract clean name (remove "MaterialExpression" prefix)
         key = full_class_name.replace("MaterialExpression", "")
@@ -250,113 +421,80 @@ class MaterialExpressionParser:
         definition = ExpressionDefinition(
             key=key,
             title=self._format_title(key),
-            category=CATEGORY_MAP.get(key, "Misc"),
-            hotkey=HOTKEY_MAP.get(key, "")
+            category=_CAT_GET(key, "Misc"),
+            hotkey=_HOT_GET(key, "")
         )
         
-        # Parse inputs
-        inputs_found = set()
+        # Parse inputs, keyed by pin id: the dict dedupes declarations and
+        # gives the default-value pass a direct lookup (insertion order is
+        # the pin order)
+        inputs_by_id = {}
         
-        # First, try to find inputs with metadata
-        for match in self.RE_INPUT.finditer(content):
-            required_str, tooltip, pin_name = match.groups()
+        # First, take inputs with metadata
+        for required_str, tooltip, pin_name in meta_inputs:
             required = required_str != "false" if required_str else True
             
-            if pin_name not in inputs_found:
-                definition.inputs.append(PinDefinition(
+            if pin_name not in inputs_by_id:
+                inputs_by_id[pin_name] = PinDefinition(
                     id=pin_name,
                     name=pin_name,
-                    pin_type=self._guess_pin_type(pin_name),
+                    pin_type=_guess_pin_type(pin_name),
                     required=required,
                     tooltip=tooltip or ""
-                ))
-                inputs_found.add(pin_name)
+                )
         
-        # Also find simple FExpressionInput declarations
-        for match in self.RE_INPUT_SIMPLE.finditer(content):
-            pin_name = match.group(1)
-            if pin_name not in inputs_found:
-                definition.inputs.append(PinDefinition(
+        # Then simple FExpressionInput declarations
+        for pin_name in simple_inputs:
+            if pin_name not in inputs_by_id:
+                inputs_by_id[pin_name] = PinDefinition(
                     id=pin_name,
                     name=pin_name,
-                    pin_type=self._guess_pin_type(pin_name),
+                    pin_type=_guess_pin_type(pin_name),
                     required=True
-                ))
-                inputs_found.add(pin_name)
+                )
         
-        # Parse default constant values
-        for match in self.RE_CONST_DEFAULT.finditer(content):
-            overriding_prop, const_name, value_str = match.groups()
-            value = self._parse_float(value_str)
-            
-            # Find the matching input and set its default
-            for inp in definition.inputs:
-                if inp.id == overriding_prop:
-                    inp.default_value = value
-                    inp.required = False
-                    break
+        # Apply default constant values to the matching input
+        for overriding_prop, const_name, value_str in const_defaults:
+            inp = inputs_by_id.get(overriding_prop)
+            if inp is not None:
+                inp.default_value = self._parse_float(value_str)
+                inp.required = False
+        
+        definition.inputs = list(inputs_by_id.values())
         
-        # Parse keywords
-        keywords_match = self.RE_KEYWORDS.search(content)
-        if keywords_match:
-            definition.keywords = keywords_match.group(1)
+        # Keywords
+        if keywords:
+            definition.keywords = keywords
         
-        # Parse creation name (display title)
-        creation_name_match = self.RE_CREATION_NAME.search(content)
-        if creation_name_match:
-            definition.title = creation_name_match.group(1)
+        # Creation name (display title)
+        if creation_name:
+            definition.title = creation_name
         
         # Add default output if no inputs suggest otherwise
         if not definition.outputs:
             definition.outputs.append(PinDefinition(
                 id="Output",
                 name="",
-                pin_type=self._guess_output_type(key, definition.inputs)
+                pin_type=_guess_output_type(key)
             ))
         
-        self.definitions.append(definition)
-        print(f"  Parsed: {key} ({len(definition.inputs)} inputs)")
         return definition
     
+    @staticmethod
+    def _groups(match: re.Match, count: int) -> tuple:
+        """Return the decoded capture groups of the _RE_ALL alternative that matched."""
+        index = match.re.groupindex[match.lastgroup]
+        return tuple(
+            group.decode('utf-8', errors='ignore') if group is not None else None
+            for group in match.groups()[index:index + count]
+        )
+    
     def _format_title(self, key: str) -> str:
         """Convert PascalCase to Title Case with spaces."""
         # Insert space before uppercase letters
         result = re.sub(r'([A-Z])', r' \1', key).strip()
         return result
     
-    def _guess_pin_type(self, name: str) -> str:
-        """Guess pin type from name."""
-        name_lower = name.lower()
-        
-        if any(x in name_lower for x in ['coord', 'uv', 'position2d']):
-            return "float2"
-        if any(x in name_lower for x in ['color', 'rgb', 'normal', 'position', 'vector', 'direction']):
-            return "float3"
-        if 'rgba' in name_lower or 'color4' in name_lower:
-            return "float4"
-        if any(x in name_lower for x in ['texture', 'tex']):
-            return "texture"
-        if any(x in name_lower for x in ['bool', 'switch', 'condition']):
-            return "bool"
-        
-        return "float"
-    
-    def _guess_output_type(self, key: str, inputs: List[PinDefinition]) -> str:
-        """Guess output type based on node key and inputs."""
-        key_lower = key.lower()
-        
-        if 'texture' in key_lower:
-            return "float4"
-        if 'normal' in key_lower:
-            return "float3"
-        if any(x in key_lower for x in ['vector', 'position', 'color', 'rgb']):
-            return "float3"
-        if 'mask' in key_lower:
-            return "float"
-        
-        # Default to float for math operations
-        return "float"
-    
     def _parse_float(self, value_str: str) -> float:
         """Parse a float value from C++ notation."""
         value_str = value_str.strip().rstrip('f')
@@ -365,24 +503,28 @@ class MaterialExpressionParser:
         except ValueError:
             return 0.0
 
+def _parse_header(file_path: str):
+    """
+    Process pool entry point: parse one header file.
+    Returns (file_path, definition, error) so the parent can report in order.
+    """
+    try:
+        return file_path, MaterialExpressionParser(os.path.dirname(file_path)).parse_file(file_path), None
+    except Exception as e:
+        return file_path, None, str(e)
+
 # =============================================================================
 # OUTPUT GENERATION
 # =============================================================================
 
-def generate_javascript(definitions: List[ExpressionDefinition], output_path: Path):
-    """Generate JavaScript module from parsed definitions."""
-    
-    # Sort by category then key
-    sorted_defs = sorted(definitions, key=lambda d: (d.category, d.key))
-    
-    # Group by category for organized output
-    categories: Dict[str, list] = {}
-    for d in sorted_defs:
-        if d.category not in categories:
-            categories[d.category] = []
-        categories[d.category].append(d.to_dict())
-    
-    js_content = '''/**
+# Reused encoders: json.dumps() with non-default options builds a new
+# JSONEncoder on every call
+NODE_ENCODER = json.JSONEncoder(indent=4)
+CATEGORY_ENCODER = json.JSONEncoder(indent=2)
+
+# Fixed text around the generated node entries. The footer is a str.format
+# template filled once with the encoded category list (hence the '}}')
+MODULE_HEADER = '''/**
  * MaterialExpressionDefinitions_generated.js
  * 
  * AUTO-GENERATED from UE5 Source Code
@@ -395,27 +537,44 @@ def generate_javascript(definitions: List[ExpressionDefinition], output_path: Pa
 
 export const MaterialExpressionDefinitions = {
 '''
-    
-    for category, nodes in categories.items():
-        js_content += f'\n  // === {category.upper()} ===\n'
-        for node in nodes:
-            js_content += f'  "{node["key"]}": {json.dumps(node, indent=4).replace(chr(10), chr(10) + "  ")},\n'
-    
-    js_content += '''
-};
+
+MODULE_FOOTER = '''
+}};
 
 // Export categories for palette organization
-export const ExpressionCategories = '''
-    js_content += json.dumps(list(categories.keys()), indent=2)
-    js_content += ';\n'
-    
-    # Also export a flat array
-    js_content += '''
+export const ExpressionCategories = {categories};
+
 // Flat array for easy iteration
 export const AllExpressions = Object.values(MaterialExpressionDefinitions);
 '''
+
+def generate_javascript(definitions: List[ExpressionDefinition], output_path: Path):
+    """Generate JavaScript module from parsed definitions."""
+    
+    # Sort by category then key
+    sorted_defs = sorted(definitions, key=lambda d: (d.category, d.key))
+    
+    # Stream the module straight to the output file: each category is
+    # converted and encoded only as it is written, so neither the full set of
+    # node dicts nor the whole JavaScript text is ever held in memory. A 1 MiB
+    # buffer batches the many small per-node writes into few syscalls
+    categories: List[str] = []
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(MODULE_HEADER)
+        
+        # Group by category for organized output
+        for category, group in groupby(sorted_defs, key=attrgetter('category')):
+            categories.append(category)
+            f.write(f'\n  // === {category.upper()} ===\n')
+            # One encode per category instead of per node: the category's
+            # {key: node} object comes out at indent 4, so dropping its braces
+            # and two spaces from each line gives the module's own layout
+            body = NODE_ENCODER.encode({d.key: d.to_dict() for d in group})
+            f.write(body[:-2].replace('\n  ', '\n')[2:])
+            f.write(',\n')
+        
+        f.write(MODULE_FOOTER.format(categories=CATEGORY_ENCODER.encode(categories)))
     
-    output_path.write_text(js_content, encoding='utf-8')
     print(f"\nGenerated: {output_path}")
     print(f"  - {len(definitions)} expressions")
     print(f"  - {len(categories)} categories")
@@ -438,6 +597,17 @@ def main():
         default=Path(__file__).parent.parent / "data" / "MaterialExpressionDefinitions_generated.js",
         help="Output JavaScript file path"
     )
+    parser.add_argument(
+        '--cache',
+        type=Path,
+        default=None,
+        help="Parse cache file, reused for unchanged headers (default: next to --output)"
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Parse every header and do not read or write the parse cache"
+    )
     
     args = parser.parse_args()
     
@@ -451,12 +621,17 @@ def main():
     print(f"Output: {args.output}")
     print()
     
+    # The parse cache is written next to the output, so create its directory first
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    
     # Parse all expressions
-    parser_instance = MaterialExpressionParser(args.source_dir)
+    cache_path = None
+    if not args.no_cache:
+        cache_path = args.cache or args.output.with_suffix('.cache.pkl')
+    parser_instance = MaterialExpressionParser(args.source_dir, cache_path)
     definitions = parser_instance.parse_all()
     
     # Generate output
-    args.output.parent.mkdir(parents=True, exist_ok=True)
     generate_javascript(definitions, args.output)
     
     return 0
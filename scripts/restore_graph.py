@@ -1,24 +1,21 @@
+import mmap
 
-import os
+from file_utils import write_if_changed
 
-file_path = r'c:\Users\Sam Deiter\Desktop\UE5LMSBlueprint-main\graph.js'
-
-with open(file_path, 'r', encoding='utf-8') as f:
-    lines = f.readlines()
 
-# Find the start of getPinsData
-start_index = -1
-for i, line in enumerate(lines):
-    if 'getPinsData() {' in line:
-        start_index = i
-        break
+file_path = r'c:\Users\Sam Deiter\Desktop\UE5LMSBlueprint-main\graph.js'
 
-if start_index == -1:
-    print("Could not find getPinsData")
-    exit(1)
+# Map the file and find getPinsData with a single C-level search, instead of
+# splitting it into a list of lines and scanning them in Python
+with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+    anchor = mm.find(b'getPinsData() {')
+    if anchor == -1:
+        print("Could not find getPinsData")
+        exit(1)
 
-# Keep everything before getPinsData
-new_content = lines[:start_index]
+    # Keep everything before the line holding getPinsData
+    new_content = mm[:mm.rfind(b'\n', 0, anchor) + 1]
+    newline = b'\r\n' if mm.find(b'\r\n') != -1 else b'\n'
 
 # Append the correct code
 correct_code = """    getPinsData() {
@@ -760,19 +757,12 @@ class GraphController {
             // CRITICAL FIX: Restore dynamic pins properly
             let pinsToLoad = template.pins;
 
-            if (nodeData.nodeKey === 'CustomEvent') {
+            if (nodeData.nodeKey === 'CustomEvent' && nodeData.pins) {
                 // Filter out legacy delegate pin from saved data if present
-                if (nodeData.pins) {
-                    nodeData.pins = nodeData.pins.filter(p => p.id !== 'delegate_out' && p.name !== 'Output Delegate');
-                }
+                nodeData.pins = nodeData.pins.filter(p => p.id !== 'delegate_out' && p.name !== 'Output Delegate');
 
                 // Logic to determine if we use saved pins (for dynamic params) or template
-                if (nodeData.pins && nodeData.pins.length > template.pins.length) {
-                    pinsToLoad = nodeData.pins;
-                }
-            } else {
-                const isCustomNode = (nodeData.nodeKey === 'CustomEvent');
-                if (isCustomNode && nodeData.pins && nodeData.pins.length > template.pins.length) {
+                if (nodeData.pins.length > template.pins.length) {
                     pinsToLoad = nodeData.pins;
                 }
             }
@@ -809,8 +799,8 @@ class GraphController {
 
 export { Pin, Node, WiringController, GraphController };"""
 
-with open(file_path, 'w', encoding='utf-8') as f:
-    f.writelines(new_content)
-    f.write(correct_code)
-
-print("Successfully restored graph.js")
+# Write (after the mapping is closed) in the file's own line endings
+if write_if_changed(file_path, new_content + correct_code.encode('utf-8').replace(b'\n', newline)):
+    print("Successfully restored graph.js")
+else:
+    print("graph.js already restored")
@@ -1,30 +1,14 @@
+import os
 import re
 
+from file_utils import write_if_changed
+
+
 # Read the file
 with open('app.js', 'r', encoding='utf-8') as f:
     content = f.read()
 
-# 1. Add Imports
-if "import { TaskManager }" not in content:
-    content = content.replace(
-        "import { BlueprintValidator, SAMPLE_TASK } from './validator.js';",
-        "import { BlueprintValidator, SAMPLE_TASK } from './validator.js';\nimport { TaskManager } from './TaskManager.js';\nimport { nodeRegistry } from './registries/NodeRegistry.js';\nimport { NodeDefinitions } from './data/NodeDefinitions.js';"
-    )
-
-if "TaskController" not in content:
-    content = content.replace(
-        "import { VariableController, PaletteController, ActionMenu, ContextMenu, DetailsController, LayoutController } from './ui.js';",
-        "import { VariableController, PaletteController, ActionMenu, ContextMenu, DetailsController, LayoutController, TaskController } from './ui.js';"
-    )
-
-# 2. Add Node Registration
-if "nodeRegistry.registerBatch" not in content:
-    content = content.replace(
-        "        // Expose for inline events (onclick)\n        window.app = BlueprintApp;",
-        "        // Expose for inline events (onclick)\n        window.app = BlueprintApp;\n\n        // Register Node Definitions\n        nodeRegistry.registerBatch(NodeDefinitions);"
-    )
-
-# 3. Add TaskManager and TaskUI Initialization
+# 3. TaskManager and TaskUI Initialization (used by the edit table below)
 validator_block = """        // 5. Blueprint Validator
         BlueprintApp.validator = new BlueprintValidator(BlueprintApp);
         window.validateSampleTask = () => BlueprintApp.validator.validateTask(SAMPLE_TASK);"""
@@ -42,11 +26,68 @@ task_system_block = """        // 5. Blueprint Validator
         // 7. Task UI Controller
         BlueprintApp.taskUI = new TaskController(BlueprintApp);"""
 
-if "BlueprintApp.taskManager" not in content:
-    content = content.replace(validator_block, task_system_block)
+# Each edit is (marker, anchor, replacement): every occurrence of anchor is
+# replaced, unless marker already appears somewhere in the file (the edit was
+# applied on an earlier run)
+EDITS = [
+    # 1. Add Imports
+    (
+        "import { TaskManager }",
+        "import { BlueprintValidator, SAMPLE_TASK } from './validator.js';",
+        "import { BlueprintValidator, SAMPLE_TASK } from './validator.js';\nimport { TaskManager } from './TaskManager.js';\nimport { nodeRegistry } from './registries/NodeRegistry.js';\nimport { NodeDefinitions } from './data/NodeDefinitions.js';"
+    ),
+    (
+        "TaskController",
+        "import { VariableController, PaletteController, ActionMenu, ContextMenu, DetailsController, LayoutController } from './ui.js';",
+        "import { VariableController, PaletteController, ActionMenu, ContextMenu, DetailsController, LayoutController, TaskController } from './ui.js';"
+    ),
+    # 2. Add Node Registration
+    (
+        "nodeRegistry.registerBatch",
+        "        // Expose for inline events (onclick)\n        window.app = BlueprintApp;",
+        "        // Expose for inline events (onclick)\n        window.app = BlueprintApp;\n\n        // Register Node Definitions\n        nodeRegistry.registerBatch(NodeDefinitions);"
+    ),
+    # 3. Add TaskManager and TaskUI Initialization
+    ("BlueprintApp.taskManager", validator_block, task_system_block),
+]
+
+ANCHORS = {anchor: (marker, replacement) for marker, anchor, replacement in EDITS}
+
+# One alternation over every marker and anchor, so a single scan of the file
+# finds both which edits are already applied and where the anchors are.
+# (No marker is a substring of an anchor, so finditer never hides one inside
+# another.) Longest first so a longer text wins over a shorter shared prefix.
+SCAN_PATTERN = re.compile('|'.join(
+    re.escape(text) for text in sorted(
+        {text for marker, anchor, _ in EDITS for text in (marker, anchor)},
+        key=len, reverse=True,
+    )
+))
+
+present = set()
+anchor_matches = []
+for match in SCAN_PATTERN.finditer(content):
+    if match.group(0) in ANCHORS:
+        anchor_matches.append(match)
+    else:
+        present.add(match.group(0))
 
-# Write back
-with open('app.js', 'w', encoding='utf-8') as f:
-    f.write(content)
+# Assemble the result once from the untouched spans and the replacements
+pieces = []
+last = 0
+for match in anchor_matches:
+    marker, replacement = ANCHORS[match.group(0)]
+    if marker in present:
+        continue
+    pieces.append(content[last:match.start()])
+    pieces.append(replacement)
+    last = match.end()
+pieces.append(content[last:])
+content = ''.join(pieces)
 
-print("Updated app.js with Task System!")
+# Write back, leaving app.js untouched when every edit was already applied.
+# Text mode wrote '\n' as os.linesep; keep that for the bytes written here.
+if write_if_changed('app.js', content.replace('\n', os.linesep)):
+    print("Updated app.js with Task System!")
+else:
+    print("app.js already up to date")
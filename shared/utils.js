@@ -18,22 +18,7 @@ class Utils {
    * @returns {string} The corresponding CSS class.
    */
   static getPinTypeClass(type) {
-    const typeMap = {
-      exec: "exec-pin",
-      bool: "bool-pin",
-      byte: "byte-pin",
-      int: "int-pin",
-      int64: "int64-pin",
-      float: "float-pin",
-      name: "name-pin",
-      string: "string-pin",
-      text: "text-pin",
-      vector: "vector-pin",
-      rotator: "rotator-pin",
-      transform: "transform-pin",
-      object: "object-pin",
-    };
-    return typeMap[type.toLowerCase()] || "default-pin";
+    return PIN_TYPE_CLASSES[type.toLowerCase()] || "default-pin";
   }
 
   /**
@@ -42,22 +27,7 @@ class Utils {
    * @returns {string} The CSS color variable string.
    */
   static getPinColor(type) {
-    const colorMap = {
-      exec: "var(--color-exec)",
-      bool: "var(--color-bool)",
-      byte: "var(--color-byte)",
-      int: "var(--color-int)",
-      int64: "var(--color-int64)",
-      float: "var(--color-float)",
-      name: "var(--color-name)",
-      string: "var(--color-string)",
-      text: "var(--color-text)",
-      vector: "var(--color-vector)",
-      rotator: "var(--color-rotator)",
-      transform: "var(--color-transform)",
-      object: "var(--color-object)",
-    };
-    return colorMap[type.toLowerCase()] || "#888888";
+    return PIN_COLORS[type.toLowerCase()] || "#888888";
   }
 
   /**
@@ -92,17 +62,16 @@ class Utils {
    * @returns {string} The SVG path data string.
    */
   static getWirePath(x1, y1, x2, y2) {
-    // Uses shared WireRenderer for consistent bezier curves
-    const distanceX = x2 - x1;
-    const absDx = Math.abs(distanceX);
-    const dx = Math.max(absDx * 0.5, 50);
-
-    const cp1x = x1 + dx;
-    const cp1y = y1;
-    const cp2x = x2 - dx;
-    const cp2y = y2;
+    // Called for every visible wire on each drag/pan frame. Work in integer
+    // tenths of a graph unit (sub-pixel up to the 1.5x max zoom), so every
+    // coordinate prints as a short decimal with no long float tail
+    const sx = Math.round(x1 * 10);
+    const sy = Math.round(y1 * 10);
+    const ex = Math.round(x2 * 10);
+    const ey = Math.round(y2 * 10);
+    const dx = Math.max(Math.round(Math.abs(ex - sx) * 0.5), 500);
 
-    return `M ${x1},${y1} C ${cp1x},${cp1y} ${cp2x},${cp2y} ${x2},${y2}`;
+    return `M ${sx / 10},${sy / 10} C ${(sx + dx) / 10},${sy / 10} ${(ex - dx) / 10},${ey / 10} ${ex / 10},${ey / 10}`;
   }
 
   /**
@@ -115,7 +84,7 @@ class Utils {
     if (!pinElement) return { x: 0, y: 0 };
 
     const pinRect = pinElement.getBoundingClientRect();
-    const graphRect = app.graph.editor.getBoundingClientRect();
+    const graphRect = app.graph.getEditorRect();
     const zoom = app.graph.zoom;
 
     const cx = pinRect.left + pinRect.width / 2;
@@ -131,21 +100,67 @@ class Utils {
    * Returns the node key for an automatic conversion node between two types, if one exists.
    */
   static getConversionNodeKey(sourceType, targetType) {
-    const key = `${sourceType}->${targetType}`;
-    const conversions = {
-      "float->string": "Conv_FloatToString",
-      "int->string": "Conv_IntToString",
-      "bool->string": "Conv_BoolToString",
-      "byte->string": "Conv_ByteToString",
-      "name->string": "Conv_NameToString",
-      "text->string": "Conv_TextToString",
-      "int->float": "Conv_IntToFloat",
-      "byte->int": "Conv_ByteToInt",
-    };
-    return conversions[key] || null;
+    const targets = CONVERSION_NODE_KEYS.get(sourceType);
+    return (targets && targets.get(targetType)) || null;
   }
 }
 
+/**
+ * Pin type -> CSS class and pin type -> color tables, built once at module
+ * load rather than on every lookup.
+ */
+const PIN_TYPE_CLASSES = {
+  exec: "exec-pin",
+  bool: "bool-pin",
+  byte: "byte-pin",
+  int: "int-pin",
+  int64: "int64-pin",
+  float: "float-pin",
+  name: "name-pin",
+  string: "string-pin",
+  text: "text-pin",
+  vector: "vector-pin",
+  rotator: "rotator-pin",
+  transform: "transform-pin",
+  object: "object-pin",
+};
+
+const PIN_COLORS = {
+  exec: "var(--color-exec)",
+  bool: "var(--color-bool)",
+  byte: "var(--color-byte)",
+  int: "var(--color-int)",
+  int64: "var(--color-int64)",
+  float: "var(--color-float)",
+  name: "var(--color-name)",
+  string: "var(--color-string)",
+  text: "var(--color-text)",
+  vector: "var(--color-vector)",
+  rotator: "var(--color-rotator)",
+  transform: "var(--color-transform)",
+  object: "var(--color-object)",
+};
+
+/**
+ * Automatic conversion node keys, as source type -> target type -> node key.
+ * Built once at module load; canConnect looks these up on every hovered pin
+ * while wiring, so a lookup is two Map gets with no key string built.
+ */
+const CONVERSION_NODE_KEYS = new Map();
+for (const [sourceType, targetType, nodeKey] of [
+  ["float", "string", "Conv_FloatToString"],
+  ["int", "string", "Conv_IntToString"],
+  ["bool", "string", "Conv_BoolToString"],
+  ["byte", "string", "Conv_ByteToString"],
+  ["name", "string", "Conv_NameToString"],
+  ["text", "string", "Conv_TextToString"],
+  ["int", "float", "Conv_IntToFloat"],
+  ["byte", "int", "Conv_ByteToInt"],
+]) {
+  if (!CONVERSION_NODE_KEYS.has(sourceType)) CONVERSION_NODE_KEYS.set(sourceType, new Map());
+  CONVERSION_NODE_KEYS.get(sourceType).set(targetType, nodeKey);
+}
+
 /**
  * Debounce function for performance
  */
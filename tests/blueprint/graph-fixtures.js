@@ -0,0 +1,65 @@
+/**
+ * Blueprint Graph Test Fixtures
+ * ==============================
+ * Builds a GraphController and WiringController without a DOM, for tests of
+ * the graph's data structures (link indexes, spatial index, state loading).
+ */
+
+import { vi } from 'vitest';
+import { GraphController } from '../../blueprint/core/graph.js';
+import { WiringController } from '../../blueprint/core/WiringController.js';
+import { NodeSpatialIndex } from '../../blueprint/core/NodeSpatialIndex.js';
+import { Node } from '../../blueprint/core/Node.js';
+
+/**
+ * Creates an app with a graph and wiring controller. The graph's fields are
+ * set as its constructor would; its DOM work (rendering, transforms) is stubbed.
+ */
+export function createApp() {
+  const app = {
+    persistence: { autoSave: vi.fn() },
+    compiler: { markDirty: vi.fn() },
+    details: { clear: vi.fn() },
+  };
+
+  const graph = Object.create(GraphController.prototype);
+  Object.assign(graph, {
+    app,
+    nodes: new Map(),
+    posX: new Float64Array(64),
+    posY: new Float64Array(64),
+    slotCount: 0,
+    pan: { x: 0, y: 0 },
+    zoom: 1,
+    pendingPositionNodes: new Set(),
+    transformPending: false,
+    selectedNodes: new Set(),
+    renderAllNodes: vi.fn(),
+    drawAllWires: vi.fn(),
+    updateTransform: vi.fn(),
+    forceTransformFlush: vi.fn(),
+    scheduleRedraw: vi.fn(),
+  });
+  graph.spatialIndex = new NodeSpatialIndex(graph);
+  app.graph = graph;
+
+  const svg = { getElementById: () => ({ addEventListener() {} }) };
+  app.wiring = new WiringController(svg, app);
+  return app;
+}
+
+/**
+ * Adds a node to the graph with a stand-in element of the given size,
+ * which is all the spatial index reads from it.
+ */
+export function addNode(app, id, pins = [], { x = 0, y = 0, width = 100, height = 50 } = {}) {
+  const node = new Node(id, { title: id, pins }, x, y, 'TestNode', app);
+  node.element = { isConnected: true, offsetWidth: width, offsetHeight: height, style: {} };
+  app.graph.nodes.set(id, node);
+  return node;
+}
+
+export const EXEC_OUT = { id: 'exec_out', name: '', type: 'exec', dir: 'out' };
+export const EXEC_IN = { id: 'exec_in', name: '', type: 'exec', dir: 'in' };
+export const FLOAT_OUT = { id: 'val_out', name: 'Value', type: 'float', dir: 'out' };
+export const FLOAT_IN = { id: 'val_in', name: 'Value', type: 'float', dir: 'in' };
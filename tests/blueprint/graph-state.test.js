@@ -0,0 +1,143 @@
+/**
+ * Tests for pin lookup and state loading in blueprint/core/graph.js
+ */
+import { describe, it, expect, beforeAll, afterAll, beforeEach } from 'vitest';
+import { nodeRegistry } from '../../blueprint/registries/NodeRegistry.js';
+import { STATE_SCHEMA_VERSION } from '../../blueprint/services/HistoryManager.js';
+import { createApp, addNode, EXEC_OUT, EXEC_IN, FLOAT_IN } from './graph-fixtures.js';
+
+const TEMPLATES = {
+    CustomEvent: { title: 'Custom Event', type: 'event', pins: [EXEC_OUT] },
+    PrintString: { title: 'Print String', type: 'impure-node', pins: [EXEC_IN, EXEC_OUT, FLOAT_IN] },
+};
+
+const DELEGATE_PIN = { id: 'delegate_out', name: 'Output Delegate', type: 'delegate', dir: 'out' };
+const CUSTOM_PIN = { id: 'amount', name: 'Amount', type: 'float', dir: 'out', isCustom: true };
+
+describe('GraphController', () => {
+    let app, graph;
+
+    beforeAll(() => {
+        for (const [key, def] of Object.entries(TEMPLATES)) nodeRegistry.register(key, def);
+    });
+
+    afterAll(() => {
+        for (const key of Object.keys(TEMPLATES)) nodeRegistry.unregister(key);
+    });
+
+    beforeEach(() => {
+        app = createApp();
+        graph = app.graph;
+    });
+
+    describe('findPinById', () => {
+        it('should find a pin on a node whose id contains dashes', () => {
+            addNode(app, 'node-abc-123', [EXEC_OUT]);
+            const pin = graph.findPinById('node-abc-123-exec_out');
+            expect(pin).toBeDefined();
+            expect(pin.node.id).toBe('node-abc-123');
+        });
+
+        it('should find a pin whose own id contains dashes', () => {
+            addNode(app, 'node-1', [{ id: 'out-value-2', name: 'Out', type: 'float', dir: 'out' }]);
+            expect(graph.findPinById('node-1-out-value-2')?.name).toBe('Out');
+        });
+
+        it('should pick the node matching the full prefix when ids share a stem', () => {
+            addNode(app, 'node-1', [EXEC_OUT]);
+            addNode(app, 'node-1-2', [EXEC_OUT]);
+            expect(graph.findPinById('node-1-exec_out').node.id).toBe('node-1');
+            expect(graph.findPinById('node-1-2-exec_out').node.id).toBe('node-1-2');
+        });
+
+        it('should return null for unknown or empty ids', () => {
+            addNode(app, 'node-1', [EXEC_OUT]);
+            expect(graph.findPinById('node-2-exec_out')).toBeNull();
+            expect(graph.findPinById('nodash')).toBeNull();
+            expect(graph.findPinById('')).toBeNull();
+        });
+    });
+
+    describe('loadState', () => {
+        const customEvent = pins => ({ id: 'node-1', nodeKey: 'CustomEvent', x: 10, y: 20, pins });
+
+        it('should drop the legacy delegate pin from states without schemaVersion', () => {
+            graph.loadState({ nodes: [customEvent([EXEC_OUT, DELEGATE_PIN, CUSTOM_PIN])] });
+
+            const node = graph.nodes.get('node-1');
+            expect(node.pins.map(p => p.id)).toEqual(['node-1-exec_out', 'node-1-amount']);
+            expect(graph.findPinById('node-1-delegate_out')).toBeNull();
+        });
+
+        it('should keep every saved pin from states at the current schemaVersion', () => {
+            graph.loadState({
+                schemaVersion: STATE_SCHEMA_VERSION,
+                nodes: [customEvent([EXEC_OUT, { ...DELEGATE_PIN, isCustom: true }, CUSTOM_PIN])],
+            });
+
+            const node = graph.nodes.get('node-1');
+            expect(node.pins.map(p => p.id)).toEqual(['node-1-exec_out', 'node-1-delegate_out', 'node-1-amount']);
+        });
+
+        it('should use template pins when no custom pins were saved', () => {
+            graph.loadState({ nodes: [customEvent([EXEC_OUT, DELEGATE_PIN])] });
+            expect(graph.nodes.get('node-1').pins.map(p => p.id)).toEqual(['node-1-exec_out']);
+        });
+
+        it('should restore positions, literals and links, and index the links', () => {
+            graph.loadState({
+                schemaVersion: STATE_SCHEMA_VERSION,
+                nodes: [
+                    customEvent([EXEC_OUT, CUSTOM_PIN]),
+                    {
+                        id: 'node-2', nodeKey: 'PrintString', x: 300, y: 40,
+                        pins: [{ id: 'node-2-val_in', literalValue: 2.5 }],
+                    },
+                ],
+                links: [
+                    { id: 'link-1', startPinId: 'node-1-exec_out', endPinId: 'node-2-exec_in' },
+                    { id: 'link-2', startPinId: 'node-1-missing', endPinId: 'node-2-val_in' },
+                ],
+                pan: { x: 5, y: 6 },
+                zoom: 2,
+            });
+
+            const printNode = graph.nodes.get('node-2');
+            expect([printNode.x, printNode.y]).toEqual([300, 40]);
+            expect(printNode.title).toBe('Print String');
+            expect(printNode.pinLiterals.get('node-2-val_in')).toBe(2.5);
+
+            expect([...app.wiring.links.keys()]).toEqual(['link-1']);
+            expect(app.wiring.findLinksByNodeId('node-2')).toHaveLength(1);
+            expect(graph.findPinById('node-1-exec_out').links.has('link-1')).toBe(true);
+            expect(graph.pan).toEqual({ x: 5, y: 6 });
+            expect(graph.zoom).toBe(2);
+            expect(graph.renderAllNodes).toHaveBeenCalledTimes(1);
+        });
+
+        it('should replace the previous graph and its links', () => {
+            const load = () => graph.loadState({
+                nodes: [customEvent([EXEC_OUT]), { id: 'node-2', nodeKey: 'PrintString', x: 0, y: 0 }],
+                links: [{ id: 'link-1', startPinId: 'node-1-exec_out', endPinId: 'node-2-exec_in' }],
+            });
+            load();
+            load();
+
+            expect(graph.nodes.size).toBe(2);
+            expect(app.wiring.links.size).toBe(1);
+            expect(app.wiring.findLinksByPinId('node-2-exec_in')).toHaveLength(1);
+        });
+
+        it('should skip nodes whose key is not registered', () => {
+            graph.loadState({ nodes: [{ id: 'node-9', nodeKey: 'Missing', x: 0, y: 0 }] });
+            expect(graph.nodes.size).toBe(0);
+        });
+
+        it('should load an empty graph from a missing state', () => {
+            addNode(app, 'node-1', [EXEC_OUT]);
+            graph.loadState(null);
+            expect(graph.nodes.size).toBe(0);
+            expect(app.wiring.links.size).toBe(0);
+        });
+    });
+});
@@ -0,0 +1,139 @@
+/**
+ * Tests for the link reverse indexes in blueprint/core/WiringController.js
+ */
+import { describe, it, expect, beforeEach } from 'vitest';
+import { createApp, addNode, EXEC_OUT, EXEC_IN, FLOAT_OUT, FLOAT_IN } from './graph-fixtures.js';
+
+describe('WiringController link indexes', () => {
+    let app, wiring, a, b, c;
+
+    beforeEach(() => {
+        app = createApp();
+        wiring = app.wiring;
+        a = addNode(app, 'node-a', [EXEC_OUT, FLOAT_OUT]);
+        b = addNode(app, 'node-b', [EXEC_IN, FLOAT_IN, EXEC_OUT]);
+        c = addNode(app, 'node-c', [EXEC_IN]);
+    });
+
+    const pin = (node, id) => node.findPinById(`${node.id}-${id}`);
+
+    describe('createConnection', () => {
+        it('should index a new link by both nodes and both pins', () => {
+            wiring.createConnection(pin(a, 'exec_out'), pin(b, 'exec_in'));
+
+            const [link] = wiring.links.values();
+            expect(wiring.findLinksByNodeId('node-a')).toEqual([link]);
+            expect(wiring.findLinksByNodeId('node-b')).toEqual([link]);
+            expect(wiring.findLinksByPinId('node-a-exec_out')).toEqual([link]);
+            expect(wiring.findLinksByPinId('node-b-exec_in')).toEqual([link]);
+        });
+
+        it('should not index a duplicate connection twice', () => {
+            wiring.createConnection(pin(a, 'exec_out'), pin(b, 'exec_in'));
+            wiring.createConnection(pin(a, 'exec_out'), pin(b, 'exec_in'));
+
+            expect(wiring.links.size).toBe(1);
+            expect(wiring.findLinksByPinId('node-a-exec_out')).toHaveLength(1);
+        });
+
+        it('should unindex the link it replaces on a single-link input', () => {
+            const other = addNode(app, 'node-d', [FLOAT_OUT]);
+            wiring.createConnection(pin(a, 'val_out'), pin(b, 'val_in'));
+            wiring.createConnection(pin(other, 'val_out'), pin(b, 'val_in'));
+
+            const links = wiring.findLinksByPinId('node-b-val_in');
+            expect(links).toHaveLength(1);
+            expect(links[0].startPin.node).toBe(other);
+            expect(wiring.findLinksByNodeId('node-a')).toEqual([]);
+            expect(wiring.linksByPin.has('node-a-val_out')).toBe(false);
+        });
+    });
+
+    describe('breakLinkById', () => {
+        it('should remove the link from every index', () => {
+            wiring.createConnection(pin(a, 'exec_out'), pin(b, 'exec_in'));
+            wiring.createConnection(pin(b, 'exec_out'), pin(c, 'exec_in'));
+            const [first] = wiring.findLinksByPinId('node-a-exec_out');
+
+            wiring.breakLinkById(first.id);
+
+            expect(wiring.links.has(first.id)).toBe(false);
+            expect(wiring.findLinksByNodeId('node-a')).toEqual([]);
+            expect(wiring.findLinksByPinId('node-b-exec_in')).toEqual([]);
+            expect(wiring.findLinksByNodeId('node-b')).toHaveLength(1);
+            // Empty sets are dropped rather than left behind
+            expect(wiring.linksByNode.has('node-a')).toBe(false);
+            expect(wiring.linksByPin.has('node-a-exec_out')).toBe(false);
+            expect(pin(a, 'exec_out').links.size).toBe(0);
+        });
+
+        it('should break every link of a pin', () => {
+            wiring.createConnection(pin(a, 'exec_out'), pin(b, 'exec_in'));
+            wiring.createConnection(pin(a, 'exec_out'), pin(c, 'exec_in'));
+
+            wiring.breakPinLinks('node-a-exec_out');
+
+            expect(wiring.links.size).toBe(0);
+            expect(wiring.linksByNode.size).toBe(0);
+            expect(wiring.linksByPin.size).toBe(0);
+        });
+    });
+
+    describe('bulkConnect', () => {
+        it('should index every link and save once', () => {
+            wiring.bulkConnect([
+                [pin(a, 'exec_out'), pin(b, 'exec_in')],
+                [pin(b, 'exec_out'), pin(c, 'exec_in')],
+                [pin(a, 'val_out'), pin(b, 'val_in')],
+            ]);
+
+            expect(wiring.links.size).toBe(3);
+            expect(wiring.findLinksByNodeId('node-b')).toHaveLength(3);
+            expect(wiring.findLinksByPinId('node-c-exec_in')).toHaveLength(1);
+            expect(app.persistence.autoSave).toHaveBeenCalledTimes(1);
+            expect(app.compiler.markDirty).toHaveBeenCalledTimes(1);
+        });
+
+        it('should skip pairs that are already linked', () => {
+            wiring.createConnection(pin(a, 'exec_out'), pin(b, 'exec_in'));
+            wiring.bulkConnect([[pin(a, 'exec_out'), pin(b, 'exec_in')]]);
+
+            expect(wiring.links.size).toBe(1);
+            expect(wiring.findLinksByNodeId('node-a')).toHaveLength(1);
+        });
+    });
+
+    describe('clearLinks', () => {
+        it('should empty the link map and both indexes', () => {
+            wiring.createConnection(pin(a, 'exec_out'), pin(b, 'exec_in'));
+            wiring.createConnection(pin(b, 'exec_out'), pin(c, 'exec_in'));
+
+            wiring.clearLinks();
+
+            expect(wiring.links.size).toBe(0);
+            expect(wiring.findLinksByNodeId('node-b')).toEqual([]);
+            expect(wiring.findLinksByPinId('node-c-exec_in')).toEqual([]);
+        });
+
+        it('should index links registered after the clear', () => {
+            wiring.createConnection(pin(a, 'exec_out'), pin(b, 'exec_in'));
+            wiring.clearLinks();
+            const link = { id: 'link-1', startPin: pin(b, 'exec_out'), endPin: pin(c, 'exec_in') };
+
+            wiring.registerLink(link);
+
+            expect(wiring.findLinksByNodeId('node-c')).toEqual([link]);
+            expect(wiring.findLinksByNodeId('node-a')).toEqual([]);
+        });
+    });
+
+    describe('unregisterLink', () => {
+        it('should tolerate links whose pins are missing', () => {
+            const link = { id: 'link-1', startPin: pin(a, 'exec_out'), endPin: pin(b, 'exec_in') };
+            wiring.registerLink(link);
+
+            expect(() => wiring.unregisterLink({ id: 'link-1', startPin: null, endPin: null })).not.toThrow();
+            expect(wiring.links.has('link-1')).toBe(false);
+        });
+    });
+});
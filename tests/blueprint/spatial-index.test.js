@@ -0,0 +1,107 @@
+/**
+ * Tests for blueprint/core/NodeSpatialIndex.js
+ */
+import { describe, it, expect, beforeEach } from 'vitest';
+import { createApp, addNode } from './graph-fixtures.js';
+
+describe('NodeSpatialIndex', () => {
+    let app, index;
+
+    beforeEach(() => {
+        app = createApp();
+        index = app.graph.spatialIndex;
+    });
+
+    const ids = hits => [...hits].map(node => node.id).sort();
+
+    it('should find nodes intersecting the query rectangle', () => {
+        addNode(app, 'node-a', [], { x: 0, y: 0 });
+        addNode(app, 'node-b', [], { x: 1000, y: 1000 });
+        addNode(app, 'node-c', [], { x: 50, y: 20 });
+        app.graph.nodes.forEach(node => index.markDirty(node));
+
+        expect(ids(index.query(-10, -10, 120, 60))).toEqual(['node-a', 'node-c']);
+        expect(ids(index.query(990, 990, 1010, 1010))).toEqual(['node-b']);
+    });
+
+    it('should not report nodes that only share a grid cell', () => {
+        const node = addNode(app, 'node-a', [], { x: 0, y: 0, width: 10, height: 10 });
+        index.markDirty(node);
+
+        expect(index.query(100, 100, 200, 200).size).toBe(0);
+    });
+
+    it('should find a node at its new position after it moves', () => {
+        const node = addNode(app, 'node-a', [], { x: 0, y: 0 });
+        index.markDirty(node);
+        expect(ids(index.query(0, 0, 50, 50))).toEqual(['node-a']);
+
+        node.x = 2000;
+        node.y = 1500;
+        node.applyPosition();
+
+        expect(index.query(0, 0, 50, 50).size).toBe(0);
+        expect(ids(index.query(2010, 1510, 2020, 1520))).toEqual(['node-a']);
+    });
+
+    it('should pick up a new size after invalidateLayout', () => {
+        const node = addNode(app, 'node-a', [], { x: 0, y: 0, width: 100, height: 50 });
+        index.markDirty(node);
+        expect(index.query(400, 0, 500, 40).size).toBe(0);
+
+        node.element.offsetWidth = 600;
+        node.invalidateLayout();
+
+        expect(ids(index.query(400, 0, 500, 40))).toEqual(['node-a']);
+    });
+
+    it('should drop a deleted node', () => {
+        const node = addNode(app, 'node-a', [], { x: 0, y: 0 });
+        addNode(app, 'node-b', [], { x: 20, y: 20 });
+        app.graph.nodes.forEach(n => index.markDirty(n));
+        expect(index.query(0, 0, 50, 50).size).toBe(2);
+
+        app.graph.nodes.delete(node.id);
+
+        expect(ids(index.query(0, 0, 50, 50))).toEqual(['node-b']);
+        expect(index.nodeCells.has(node)).toBe(false);
+    });
+
+    it('should drop a node deleted while a move was pending', () => {
+        const node = addNode(app, 'node-a', [], { x: 0, y: 0 });
+        index.markDirty(node);
+        index.query(0, 0, 50, 50);
+
+        node.x = 800;
+        node.applyPosition();
+        app.graph.nodes.delete(node.id);
+
+        expect(index.query(0, 0, 1000, 1000).size).toBe(0);
+        expect(index.pending.size).toBe(0);
+        expect(index.cells.size).toBe(0);
+    });
+
+    it('should keep unrendered nodes pending until they are in the DOM', () => {
+        const node = addNode(app, 'node-a', [], { x: 0, y: 0 });
+        node.element.isConnected = false;
+        index.markDirty(node);
+
+        expect(index.query(0, 0, 50, 50).size).toBe(0);
+        expect(index.pending.has(node)).toBe(true);
+
+        node.element.isConnected = true;
+        expect(ids(index.query(0, 0, 50, 50))).toEqual(['node-a']);
+    });
+
+    it('should be empty after clear', () => {
+        const node = addNode(app, 'node-a', [], { x: 0, y: 0 });
+        index.markDirty(node);
+        index.query(0, 0, 50, 50);
+
+        index.clear();
+
+        expect(index.cells.size).toBe(0);
+        expect(index.nodeCells.size).toBe(0);
+        expect(index.query(0, 0, 50, 50).size).toBe(0);
+    });
+});
@@ -0,0 +1,76 @@
+"""
+Regression tests for scripts/parse_ue5_expressions.py.
+Run with: python -m unittest discover -s tests/scripts
+"""
+
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parents[2] / 'scripts' / 'parse_ue5_expressions.py'
+_spec = importlib.util.spec_from_file_location('parse_ue5_expressions', SCRIPT)
+parser_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(parser_module)
+
+# GetKeywords/GetCreationName declared without a body, before the inputs
+PANNER_HEADER = b'''
+UCLASS()
+class ENGINE_API UMaterialExpressionPanner : public UMaterialExpression
+{
+#if WITH_EDITOR
+	virtual FText GetKeywords() const override;
+	virtual FText GetCreationName() const override;
+#endif
+
+	UPROPERTY(meta = (RequiredInput = "false", ToolTip = "Defaults to 'ConstCoordinate' if not specified"))
+	FExpressionInput Coordinate;
+
+	UPROPERTY(meta = (RequiredInput = "false", ToolTip = "Defaults to Game Time if not specified"))
+	FExpressionInput Time;
+
+	virtual void GetCaption(TArray<FString>& OutCaptions) const override { OutCaptions.Add(TEXT("Panner")); }
+};
+'''
+
+# A bodiless GetCreationName followed by an inline GetKeywords body
+MULTIPLY_HEADER = b'''
+UCLASS()
+class ENGINE_API UMaterialExpressionMultiply : public UMaterialExpression
+{
+	virtual FText GetCreationName() const override;
+	UPROPERTY()
+	FExpressionInput A;
+	UPROPERTY()
+	FExpressionInput B;
+	virtual FText GetKeywords() const override {return FText::FromString(TEXT("*"));}
+};
+'''
+
+
+class BodilessDeclarationTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.parser = parser_module.MaterialExpressionParser(Path(self.tmp.name))
+
+    def parse(self, name, content):
+        path = Path(self.tmp.name) / name
+        path.write_bytes(content)
+        return self.parser.parse_file(str(path))
+
+    def test_bodiless_declarations_keep_following_inputs(self):
+        definition = self.parse('MaterialExpressionPanner.h', PANNER_HEADER)
+        self.assertEqual([pin.id for pin in definition.inputs], ['Coordinate', 'Time'])
+        self.assertEqual(definition.keywords, '')
+        self.assertEqual(definition.title, 'Panner')
+
+    def test_inline_keywords_after_bodiless_creation_name(self):
+        definition = self.parse('MaterialExpressionMultiply.h', MULTIPLY_HEADER)
+        self.assertEqual([pin.id for pin in definition.inputs], ['A', 'B'])
+        self.assertEqual(definition.keywords, '*')
+        self.assertEqual(definition.title, 'Multiply')
+
+
+if __name__ == '__main__':
+    unittest.main()